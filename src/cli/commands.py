@@ -3,6 +3,7 @@ import json
 import click
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List
 from loguru import logger
 from tabulate import tabulate
 
@@ -41,7 +42,7 @@ def _find_job_description(job_dir: Path) -> Path:
     return candidates[0]
 
 
-def _find_application_files(app_dir: Path) -> list[Path]:
+def _find_application_files(app_dir: Path) -> List[Path]:
     if not app_dir.is_dir():
         raise ValueError(f"Applications folder not found: {app_dir}")
     return sorted(
@@ -83,9 +84,24 @@ def _create_job_from_file(db, file_path: Path) -> Job:
     return job
 
 
-def _create_application_from_file(db, file_path: Path, job: Job):
-    parser = ResumeParser()
-    resume_data = parser.parse_file(str(file_path))
+def _parse_application_files(file_paths: List[Path]) -> Dict[Path, Dict[str, Any]]:
+    """Parse resumes in shared LLM calls, keyed by path.
+
+    Returns an empty dict if the batch fails, so each file is then parsed on its
+    own and a bad file only fails its own application.
+    """
+    try:
+        parsed = ResumeParser().parse_files([str(path) for path in file_paths])
+    except Exception as exc:
+        logger.warning(f"Batch resume parsing failed, parsing files one at a time: {exc}")
+        return {}
+    return dict(zip(file_paths, parsed))
+
+
+def _create_application_from_file(db, file_path: Path, job: Job, resume_data=None):
+    if resume_data is None:
+        parser = ResumeParser()
+        resume_data = parser.parse_file(str(file_path))
 
     basics = resume_data.get('basics', {})
     name = basics.get('name', 'Unknown')
@@ -385,13 +401,14 @@ def directory_load(directory_path: str):
                     errors.append(error_msg)
                     continue
 
+                parsed_resumes = _parse_application_files(application_files)
                 for application_file in application_files:
                     click.echo(
                         f"  Processing application: {application_file.name}"
                     )
                     try:
                         candidate, application, _ = _create_application_from_file(
-                            db, application_file, job
+                            db, application_file, job, parsed_resumes.get(application_file)
                         )
                         total_applications += 1
                         click.echo(
@@ -34,6 +34,15 @@ class Config:
     JOB_MODEL = os.getenv("JOB_MODEL", DEFAULT_MODEL)
     MATCH_MODEL = os.getenv("MATCH_MODEL", DEFAULT_MODEL)
     
+    # Parse result cache
+    PARSE_CACHE_ENABLED = os.getenv("PARSE_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+    PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR", str(Path.home() / ".cache" / "savannah" / "parse"))
+    
+    # Longest document text sent to the LLM; longer inputs keep their head and tail
+    PARSE_MAX_INPUT_CHARS = int(os.getenv("PARSE_MAX_INPUT_CHARS", "32000"))
+    # Shorter documents (a bare title or URL) get a stub instead of an LLM call
+    PARSE_MIN_INPUT_CHARS = int(os.getenv("PARSE_MIN_INPUT_CHARS", "100"))
+    
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -6,6 +6,9 @@ from sqlalchemy.orm import relationship
 
 from src.database.connection import Base
 
+# JSONB on PostgreSQL, plain JSON on other databases such as the SQLite test database.
+JSONPayload = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Candidate(Base):
     """Candidate model - stores structured resume data in JSON Resume format."""
@@ -105,7 +108,7 @@ class WhatIfScenario(Base):
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
 
     name = Column(String, index=True)
-    scenario_payload = Column(JSONB, nullable=False)
+    scenario_payload = Column(JSONPayload, nullable=False)
 
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -124,7 +127,7 @@ class OptimisationRecord(Base):
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
 
     name = Column(String, index=True)
-    optimisation_payload = Column(JSONB, nullable=False)
+    optimisation_payload = Column(JSONPayload, nullable=False)
 
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
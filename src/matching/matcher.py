@@ -1,10 +1,11 @@
 """LLM-based matching service for candidates and jobs."""
 import json
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from loguru import logger
 
 from src.config import Config
+from src.utils import fast_json
 
 MATCH_SCHEMA = {
     "type": "object",
@@ -89,6 +90,11 @@ MATCH_SCHEMA = {
     ]
 }
 
+DEFAULT_SYSTEM_MESSAGE = "You are a helpful assistant that provides structured, accurate responses."
+
+_NORMALIZED_SCHEMA_LIMIT = 32
+_NORMALIZED_SCHEMAS: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
 
 class LLMClient:
     """Client for calling LLM APIs (OpenAI or OpenRouter)."""
@@ -154,6 +160,12 @@ class LLMClient:
             raise
 
     def _normalize_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        # Schemas are module-level constants, so the normalized form is reused by
+        # identity; the original is kept alongside so its id cannot be recycled.
+        cached = _NORMALIZED_SCHEMAS.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
         def normalize(node: Any) -> Any:
             if isinstance(node, dict):
                 normalized = {key: normalize(value) for key, value in node.items()}
@@ -172,7 +184,11 @@ class LLMClient:
                 return [normalize(item) for item in node]
             return node
 
-        return normalize(schema)
+        normalized = normalize(schema)
+        if len(_NORMALIZED_SCHEMAS) >= _NORMALIZED_SCHEMA_LIMIT:
+            _NORMALIZED_SCHEMAS.clear()
+        _NORMALIZED_SCHEMAS[id(schema)] = (schema, normalized)
+        return normalized
     
     def call_llm(
         self,
@@ -181,7 +197,8 @@ class LLMClient:
         max_tokens: int = 4000,
         context: Optional[str] = None,
         schema: Optional[Dict[str, Any]] = None,
-        function_name: Optional[str] = None
+        function_name: Optional[str] = None,
+        system: Optional[str] = None
     ) -> Any:
         """
         Call the LLM API with a prompt.
@@ -193,10 +210,14 @@ class LLMClient:
             context: Optional label describing the call site
             schema: JSON schema describing structured output
             function_name: Function name for tool-based structured output
+            system: Optional system message; keep it identical across calls so
+                providers can reuse the cached prompt prefix
             
         Returns:
             The LLM response text or structured output
         """
+        system_message = system or DEFAULT_SYSTEM_MESSAGE
+
         try:
             if schema:
                 if context:
@@ -209,10 +230,7 @@ class LLMClient:
                     normalized_schema = self._normalize_schema(schema)
                     response = self._create_completion(
                         messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a helpful assistant that provides structured, accurate responses."
-                            },
+                            {"role": "system", "content": system_message},
                             {"role": "user", "content": prompt}
                         ],
                         temperature=temperature,
@@ -234,25 +252,22 @@ class LLMClient:
                         logger.debug("LLM raw response:\n{}", content)
 
                     try:
-                        parsed = json.loads(content)
+                        parsed = fast_json.loads(content)
                     except json.JSONDecodeError as e:
                         logger.error(f"Failed to parse JSON schema response: {e}")
                         logger.debug("Raw response: {}", content)
                         raise
 
                     if context:
-                        logger.info("LLM structured response ({}):\n{}", context, json.dumps(parsed, indent=2))
+                        logger.info("LLM structured response ({}):\n{}", context, fast_json.dumps(parsed, indent=True))
                     else:
-                        logger.info("LLM structured response:\n{}", json.dumps(parsed, indent=2))
+                        logger.info("LLM structured response:\n{}", fast_json.dumps(parsed, indent=True))
 
                     return parsed
 
                 response = self._create_completion(
                     messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant that provides structured, accurate responses."
-                        },
+                        {"role": "system", "content": system_message},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=temperature,
@@ -282,16 +297,16 @@ class LLMClient:
                     logger.debug("LLM raw response:\n{}", arguments)
 
                 try:
-                    parsed = json.loads(arguments)
+                    parsed = fast_json.loads(arguments)
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse tool arguments as JSON: {e}")
                     logger.debug("Tool arguments: {}", arguments)
                     raise
 
                 if context:
-                    logger.info("LLM structured response ({}):\n{}", context, json.dumps(parsed, indent=2))
+                    logger.info("LLM structured response ({}):\n{}", context, fast_json.dumps(parsed, indent=True))
                 else:
-                    logger.info("LLM structured response:\n{}", json.dumps(parsed, indent=2))
+                    logger.info("LLM structured response:\n{}", fast_json.dumps(parsed, indent=True))
 
                 return parsed
 
@@ -302,7 +317,7 @@ class LLMClient:
 
             response = self._create_completion(
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that provides structured, accurate responses."},
+                    {"role": "system", "content": system_message},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=temperature,
@@ -321,12 +336,25 @@ class LLMClient:
             raise
 
 
+_LLM_CLIENTS: Dict[Tuple[str, Optional[str]], LLMClient] = {}
+
+
+def get_llm_client(model: Optional[str] = None) -> LLMClient:
+    """Return a shared LLMClient for model so its HTTP connection pool is reused."""
+    key = (Config.LLM_PROVIDER, model)
+    client = _LLM_CLIENTS.get(key)
+    if client is None:
+        client = LLMClient(model=model)
+        _LLM_CLIENTS[key] = client
+    return client
+
+
 class CandidateJobMatcher:
     """Match candidates to jobs using LLM analysis."""
     
     def __init__(self):
         """Initialize the matcher."""
-        self.llm_client = LLMClient(model=Config.MATCH_MODEL)
+        self.llm_client = get_llm_client(Config.MATCH_MODEL)
 
     def _is_non_empty_string(self, value: Any) -> bool:
         return isinstance(value, str) and value.strip() != ""
@@ -557,10 +585,10 @@ class CandidateJobMatcher:
         prompt = f"""You are an expert technical recruiter. Evaluate candidate–job fit fairly and precisely, using ONLY the provided data.
 
     CANDIDATE DATA (JSON Resume format):
-    {json.dumps(candidate_data, indent=2)}
+    {fast_json.dumps(candidate_data, indent=True)}
 
     JOB DESCRIPTION DATA (parsed JSON):
-    {json.dumps(job_data, indent=2)}
+    {fast_json.dumps(job_data, indent=True)}
 
     The job requirements are located at:
     - job_data["requirements"]["must_have_skills"]      # list of required skill/experience statements
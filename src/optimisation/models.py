@@ -1,6 +1,6 @@
 """Models and validation for optimisation payloads."""
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 RELAX_REMOVE_NICE = "remove_nice_to_have"
@@ -99,6 +99,8 @@ class OptimisationConfig:
 
 @dataclass
 class RelaxationChange:
+    __slots__ = ("kind", "detail", "cost")
+
     kind: str
     detail: Dict[str, Any]
     cost: float
@@ -111,14 +113,39 @@ class RelaxationChange:
         }
 
 
+# Persistent change list: (newest change, parent node). Extending a plan is O(1)
+# and siblings share their common prefix instead of copying it.
+ChangeNode = Optional[Tuple[RelaxationChange, "ChangeNode"]]
+
+
+def iter_changes(head: ChangeNode) -> Iterator[RelaxationChange]:
+    """Yield changes from a node chain, newest first."""
+    while head is not None:
+        change, head = head
+        yield change
+
+
+def materialise_changes(head: ChangeNode) -> List[RelaxationChange]:
+    """Flatten a change node chain into a list ordered oldest first."""
+    changes = list(iter_changes(head))
+    changes.reverse()
+    return changes
+
+
 @dataclass
 class OptimisationResult:
     scenario: Dict[str, Any]
-    changes: List[RelaxationChange]
+    changes_head: ChangeNode
     cost: float
     summary: Dict[str, Any]
     candidate_count: int
 
+    @property
+    def changes(self) -> List[RelaxationChange]:
+        # Searches keep many more results than they return, so the list is only
+        # built for the results that are reported.
+        return materialise_changes(self.changes_head)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "candidate_count": self.candidate_count,
@@ -1,18 +1,28 @@
 """Orchestration for optimisation runs."""
 from typing import Any, Dict, List, Optional, cast
-import json
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from src.database.models import Job, Application, Candidate
-from src.what_if.evaluator import evaluate_applications
+from src.what_if.evaluator import MatchSets, evaluate_applications
 from src.what_if.scenario import (
-    DEFAULT_SCENARIO,
     build_shock_report,
+    copy_default_scenario,
     normalize_scenario
 )
 from src.optimisation.factory import StrategyFactory
 from src.optimisation.models import (
+    RELAX_ALLOW_PARTIALS,
+    RELAX_DEMOTE_MUST,
+    RELAX_DISABLE_EDUCATION,
+    RELAX_INCREASE_PARTIAL_WEIGHT,
+    RELAX_LOWER_COVERAGE_MIN,
+    RELAX_LOWER_MIN_YEARS,
+    RELAX_LOWER_THRESHOLD,
+    RELAX_REMOVE_MUST,
+    RELAX_REMOVE_NICE,
+    RELAX_WEIGHTS_OVERRIDE,
+    ChangeNode,
     OptimisationConfig,
     OptimisationResult,
     OptimisationValidationError,
@@ -21,12 +31,28 @@ from src.optimisation.models import (
 from src.optimisation.space import RelaxationSpace
 from src.optimisation.strategies.base import SearchContext
 
+# Positions within the tuple returned by ScenarioEvaluator.key_for.
+_KEY_MIN_YEARS = 0
+_KEY_EDUCATION = 1
+_KEY_ADD_MUST = 2
+_KEY_ADD_NICE = 3
+_KEY_REMOVE_MUST = 4
+_KEY_REMOVE_NICE = 5
+_KEY_MATCH_MODE = 6
+_KEY_PARTIAL_WEIGHT = 7
+_KEY_COVERAGE_MIN = 9
+_KEY_WEIGHTS = 11
+_KEY_THRESHOLD = 12
+
 
 class ScenarioEvaluator:
     def __init__(self, job_data: Dict[str, Any], applications: List[Any]):
         self.job_data = job_data
         self.applications = applications
         self._cache: Dict[Any, Dict[str, Any]] = {}
+        # Skill sets per application for this sweep; self.applications keeps the
+        # match_data buckets alive, so their ids stay valid.
+        self.match_sets: MatchSets = {}
 
     def key_for(self, scenario: Dict[str, Any]) -> Any:
         scenario_block = scenario["scenario"]
@@ -52,8 +78,50 @@ class ScenarioEvaluator:
             optimization.get("overall_score_threshold")
         )
 
-    def evaluate(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
-        key = self.key_for(scenario)
+    def key_after(self, parent_key: Any, action: Any) -> Any:
+        """Return the key of the scenario produced by applying action to parent_key.
+
+        Mirrors RelaxationSpace.apply_action on the key tuple itself, so callers
+        can discard already-visited branches before copying the scenario.
+        """
+        key = list(parent_key)
+        kind = action.kind
+        detail = action.detail
+
+        if kind == RELAX_REMOVE_NICE:
+            skill = detail["skill"]
+            key[_KEY_REMOVE_NICE] = _with_skill(key[_KEY_REMOVE_NICE], skill)
+            key[_KEY_ADD_NICE] = _without_skill(key[_KEY_ADD_NICE], skill)
+        elif kind == RELAX_REMOVE_MUST:
+            skill = detail["skill"]
+            key[_KEY_REMOVE_MUST] = _with_skill(key[_KEY_REMOVE_MUST], skill)
+            key[_KEY_REMOVE_NICE] = _with_skill(key[_KEY_REMOVE_NICE], skill)
+            key[_KEY_ADD_MUST] = _without_skill(key[_KEY_ADD_MUST], skill)
+            key[_KEY_ADD_NICE] = _without_skill(key[_KEY_ADD_NICE], skill)
+        elif kind == RELAX_DEMOTE_MUST:
+            skill = detail["skill"]
+            key[_KEY_REMOVE_MUST] = _with_skill(key[_KEY_REMOVE_MUST], skill)
+            key[_KEY_ADD_NICE] = _with_skill(key[_KEY_ADD_NICE], skill)
+        elif kind == RELAX_LOWER_MIN_YEARS:
+            key[_KEY_MIN_YEARS] = int(detail["to"])
+        elif kind == RELAX_DISABLE_EDUCATION:
+            key[_KEY_EDUCATION] = False
+        elif kind == RELAX_ALLOW_PARTIALS:
+            key[_KEY_MATCH_MODE] = "partial_ok"
+        elif kind == RELAX_INCREASE_PARTIAL_WEIGHT:
+            key[_KEY_PARTIAL_WEIGHT] = float(detail["to"])
+        elif kind == RELAX_LOWER_COVERAGE_MIN:
+            key[_KEY_COVERAGE_MIN] = float(detail["to"])
+        elif kind == RELAX_LOWER_THRESHOLD:
+            key[_KEY_THRESHOLD] = float(detail["to"])
+        elif kind == RELAX_WEIGHTS_OVERRIDE:
+            key[_KEY_WEIGHTS] = tuple(sorted((detail["weights"] or {}).items()))
+
+        return tuple(key)
+
+    def evaluate(self, scenario: Dict[str, Any], key: Any = None) -> Dict[str, Any]:
+        if key is None:
+            key = self.key_for(scenario)
         if key in self._cache:
             return self._cache[key]
         evaluation = evaluate_applications(
@@ -61,7 +129,8 @@ class ScenarioEvaluator:
             self.job_data,
             scenario,
             include_details=False,
-            include_summary_table=False
+            include_summary_table=False,
+            match_sets=self.match_sets
         )
         summary = evaluation.get("summary", {})
         payload = {
@@ -74,13 +143,14 @@ class ScenarioEvaluator:
     def make_result(
         self,
         scenario: Dict[str, Any],
-        changes: List[Any],
-        cost: float
+        changes_head: ChangeNode,
+        cost: float,
+        key: Any = None
     ) -> OptimisationResult:
-        evaluation = self.evaluate(scenario)
+        evaluation = self.evaluate(scenario, key)
         return OptimisationResult(
             scenario=scenario,
-            changes=changes,
+            changes_head=changes_head,
             cost=cost,
             summary=evaluation["summary"],
             candidate_count=evaluation["candidate_count"]
@@ -118,7 +188,7 @@ def run_optimisation(
         config.top_k = top_k_override
 
     baseline_scenario, _ = normalize_scenario(
-        json.loads(json.dumps(DEFAULT_SCENARIO)),
+        copy_default_scenario(),
         job_data,
         strict=True
     )
@@ -126,6 +196,7 @@ def run_optimisation(
     applications = (
         db.query(Application)
         .join(Candidate)
+        .options(contains_eager(Application.candidate))
         .filter(Application.job_id == job_id)
         .all()
     )
@@ -173,7 +244,8 @@ def run_optimisation(
                 job_data,
                 scenario,
                 include_details=include_details,
-                include_summary_table=include_summary_table
+                include_summary_table=include_summary_table,
+                match_sets=evaluator.match_sets
             )
             if include_details:
                 output_results[index]["candidates"] = evaluation.get("candidates", [])
@@ -183,6 +255,16 @@ def run_optimisation(
     return output
 
 
+def _with_skill(skills: tuple, skill: str) -> tuple:
+    if skill in skills:
+        return skills
+    return tuple(sorted(skills + (skill,)))
+
+
+def _without_skill(skills: tuple, skill: str) -> tuple:
+    return tuple(item for item in skills if item != skill)
+
+
 def _rank_result(result: OptimisationResult, target_count: int) -> tuple:
     meets_target = result.candidate_count >= target_count
     average_score = result.summary.get("average_score", 0.0)
@@ -1,9 +1,9 @@
 """Relaxation search space and action application."""
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-import copy
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Set
 
-from src.what_if.scenario import apply_skill_edits
+from src.what_if.scenario import apply_skill_edits, copy_scenario
 from src.optimisation.models import (
     RELAX_ALLOW_PARTIALS,
     RELAX_DEMOTE_MUST,
@@ -19,9 +19,27 @@ from src.optimisation.models import (
     RelaxationChange
 )
 
+_SKILL_RELAXATIONS = frozenset((RELAX_REMOVE_NICE, RELAX_REMOVE_MUST, RELAX_DEMOTE_MUST))
+
+# Relaxations that step one numeric scenario value towards a bound:
+# (kind, section, field, direction, cast). The field also names the range
+# constraint in OptimisationConstraints that supplies the step and bound.
+_STEP_ACTIONS = (
+    (RELAX_LOWER_MIN_YEARS, "scenario", "min_years_override", -1, int),
+    (RELAX_INCREASE_PARTIAL_WEIGHT, "evaluation", "partial_match_weight", 1, float),
+    (RELAX_LOWER_COVERAGE_MIN, "evaluation", "must_have_coverage_min", -1, float),
+    (RELAX_LOWER_THRESHOLD, "optimization", "overall_score_threshold", -1, float)
+)
+
+# Actions are offered in priority order; cost and kind break ties so the
+# order is deterministic.
+_ACTION_ORDER = attrgetter("priority", "cost", "kind")
+
 
 @dataclass
 class RelaxationAction:
+    __slots__ = ("kind", "detail", "cost", "priority")
+
     kind: str
     detail: Dict[str, Any]
     cost: float
@@ -34,24 +52,39 @@ class RelaxationSpace:
     def __init__(self, job_data: Dict[str, Any], config: OptimisationConfig):
         self.job_data = job_data
         self.config = config
+        # These actions carry no scenario-dependent detail, so every node
+        # that offers them can share one instance.
+        self._education_action = RelaxationAction(
+            kind=RELAX_DISABLE_EDUCATION,
+            detail={},
+            cost=self._cost(RELAX_DISABLE_EDUCATION),
+            priority=4
+        )
+        self._partials_action = RelaxationAction(
+            kind=RELAX_ALLOW_PARTIALS,
+            detail={},
+            cost=self._cost(RELAX_ALLOW_PARTIALS),
+            priority=4
+        )
 
     def list_actions(
         self,
         scenario: Dict[str, Any],
-        changes: List[RelaxationChange]
+        changes: Iterable[RelaxationChange]
     ) -> List[RelaxationAction]:
         actions: List[RelaxationAction] = []
         allowed = set(self.config.constraints.allowed_relaxations)
         change_counts = _count_skill_changes(changes)
 
-        if RELAX_REMOVE_NICE in allowed:
-            actions.extend(self._remove_nice_actions(scenario, change_counts))
-        if RELAX_DEMOTE_MUST in allowed:
-            actions.extend(self._demote_must_actions(scenario, change_counts))
-        if RELAX_REMOVE_MUST in allowed:
-            actions.extend(self._remove_must_actions(scenario, change_counts))
-        if RELAX_LOWER_MIN_YEARS in allowed:
-            actions.extend(self._lower_min_years_actions(scenario))
+        if allowed & _SKILL_RELAXATIONS and not self._max_skill_changes_reached(change_counts):
+            # All skill relaxations enumerate the same effective requirements.
+            effective = apply_skill_edits(self.job_data, scenario)
+            if RELAX_REMOVE_NICE in allowed:
+                actions.extend(self._remove_nice_actions(effective))
+            if RELAX_DEMOTE_MUST in allowed:
+                actions.extend(self._demote_must_actions(effective))
+            if RELAX_REMOVE_MUST in allowed:
+                actions.extend(self._remove_must_actions(effective))
         if RELAX_DISABLE_EDUCATION in allowed:
             action = self._disable_education_action(scenario)
             if action:
@@ -60,22 +93,11 @@ class RelaxationSpace:
             action = self._allow_partials_action(scenario)
             if action:
                 actions.append(action)
-        if RELAX_INCREASE_PARTIAL_WEIGHT in allowed:
-            action = self._increase_partial_weight_action(scenario)
-            if action:
-                actions.append(action)
-        if RELAX_LOWER_COVERAGE_MIN in allowed:
-            action = self._lower_coverage_min_action(scenario)
-            if action:
-                actions.append(action)
-        if RELAX_LOWER_THRESHOLD in allowed:
-            action = self._lower_threshold_action(scenario)
-            if action:
-                actions.append(action)
+        actions.extend(self._step_actions(scenario, allowed))
         if RELAX_WEIGHTS_OVERRIDE in allowed:
             actions.extend(self._weights_override_actions(scenario))
 
-        actions.sort(key=lambda item: (item.priority, item.cost, item.kind))
+        actions.sort(key=_ACTION_ORDER)
         return actions
 
     def apply_action(
@@ -83,7 +105,7 @@ class RelaxationSpace:
         scenario: Dict[str, Any],
         action: RelaxationAction
     ) -> Dict[str, Any]:
-        updated = copy.deepcopy(scenario)
+        updated = copy_scenario(scenario)
 
         if action.kind == RELAX_REMOVE_NICE:
             skill = action.detail["skill"]
@@ -119,19 +141,16 @@ class RelaxationSpace:
 
     def _remove_nice_actions(
         self,
-        scenario: Dict[str, Any],
-        change_counts: Dict[str, int]
+        effective: Dict[str, List[str]]
     ) -> List[RelaxationAction]:
-        if self._max_skill_changes_reached(change_counts):
-            return []
-        effective = apply_skill_edits(self.job_data, scenario)
+        cost = self._cost(RELAX_REMOVE_NICE)
         actions = []
         for skill in effective["nice_to_have"]:
             actions.append(
                 RelaxationAction(
                     kind=RELAX_REMOVE_NICE,
                     detail={"skill": skill},
-                    cost=self._cost(RELAX_REMOVE_NICE),
+                    cost=cost,
                     priority=1
                 )
             )
@@ -139,19 +158,16 @@ class RelaxationSpace:
 
     def _remove_must_actions(
         self,
-        scenario: Dict[str, Any],
-        change_counts: Dict[str, int]
+        effective: Dict[str, List[str]]
     ) -> List[RelaxationAction]:
-        if self._max_skill_changes_reached(change_counts):
-            return []
-        effective = apply_skill_edits(self.job_data, scenario)
+        cost = self._cost(RELAX_REMOVE_MUST)
         actions = []
         for skill in effective["must_have"]:
             actions.append(
                 RelaxationAction(
                     kind=RELAX_REMOVE_MUST,
                     detail={"skill": skill},
-                    cost=self._cost(RELAX_REMOVE_MUST),
+                    cost=cost,
                     priority=3
                 )
             )
@@ -159,45 +175,21 @@ class RelaxationSpace:
 
     def _demote_must_actions(
         self,
-        scenario: Dict[str, Any],
-        change_counts: Dict[str, int]
+        effective: Dict[str, List[str]]
     ) -> List[RelaxationAction]:
-        if self._max_skill_changes_reached(change_counts):
-            return []
-        effective = apply_skill_edits(self.job_data, scenario)
+        cost = self._cost(RELAX_DEMOTE_MUST)
         actions = []
         for skill in effective["must_have"]:
             actions.append(
                 RelaxationAction(
                     kind=RELAX_DEMOTE_MUST,
                     detail={"skill": skill},
-                    cost=self._cost(RELAX_DEMOTE_MUST),
+                    cost=cost,
                     priority=2
                 )
             )
         return actions
 
-    def _lower_min_years_actions(self, scenario: Dict[str, Any]) -> List[RelaxationAction]:
-        constraint = self.config.constraints.min_years_override
-        if constraint.step is None:
-            return []
-        current = scenario["scenario"]["min_years_override"]
-        if current is None:
-            requirements = self.job_data.get("requirements", {}) if isinstance(self.job_data, dict) else {}
-            current = requirements.get("minimum_years_experience") or 0
-        min_value = constraint.min_value if constraint.min_value is not None else 0
-        next_value = current - constraint.step
-        if next_value < min_value:
-            return []
-        return [
-            RelaxationAction(
-                kind=RELAX_LOWER_MIN_YEARS,
-                detail={"from": current, "to": int(next_value)},
-                cost=self._cost(RELAX_LOWER_MIN_YEARS),
-                priority=4
-            )
-        ]
-
     def _disable_education_action(self, scenario: Dict[str, Any]) -> Optional[RelaxationAction]:
         override = scenario["scenario"].get("education_required_override")
         if override is False:
@@ -206,80 +198,60 @@ class RelaxationSpace:
         required_education = requirements.get("required_education") or {}
         if override is None and not required_education.get("required"):
             return None
-        return RelaxationAction(
-            kind=RELAX_DISABLE_EDUCATION,
-            detail={},
-            cost=self._cost(RELAX_DISABLE_EDUCATION),
-            priority=4
-        )
+        return self._education_action
 
     def _allow_partials_action(self, scenario: Dict[str, Any]) -> Optional[RelaxationAction]:
         if scenario["evaluation"]["match_mode"] == "partial_ok":
             return None
-        return RelaxationAction(
-            kind=RELAX_ALLOW_PARTIALS,
-            detail={},
-            cost=self._cost(RELAX_ALLOW_PARTIALS),
-            priority=4
-        )
+        return self._partials_action
 
-    def _increase_partial_weight_action(
+    def _step_actions(
         self,
-        scenario: Dict[str, Any]
-    ) -> Optional[RelaxationAction]:
-        if scenario["evaluation"]["match_mode"] != "partial_ok":
-            return None
-        constraint = self.config.constraints.partial_match_weight
-        if constraint.step is None or constraint.max_value is None:
-            return None
-        current = scenario["evaluation"]["partial_match_weight"] or 0.0
-        next_value = min(current + constraint.step, constraint.max_value)
-        if next_value <= current:
-            return None
-        return RelaxationAction(
-            kind=RELAX_INCREASE_PARTIAL_WEIGHT,
-            detail={"from": current, "to": next_value},
-            cost=self._cost(RELAX_INCREASE_PARTIAL_WEIGHT),
-            priority=4
-        )
+        scenario: Dict[str, Any],
+        allowed: Set[str]
+    ) -> List[RelaxationAction]:
+        constraints = self.config.constraints
+        actions = []
+        for kind, section, field, direction, cast in _STEP_ACTIONS:
+            if kind not in allowed:
+                continue
+            constraint = getattr(constraints, field)
+            if constraint.step is None:
+                continue
 
-    def _lower_coverage_min_action(
-        self,
-        scenario: Dict[str, Any]
-    ) -> Optional[RelaxationAction]:
-        constraint = self.config.constraints.must_have_coverage_min
-        if constraint.step is None:
-            return None
-        current = scenario["evaluation"]["must_have_coverage_min"] or 0.0
-        min_value = constraint.min_value if constraint.min_value is not None else 0.0
-        next_value = current - constraint.step
-        if next_value < min_value:
-            return None
-        return RelaxationAction(
-            kind=RELAX_LOWER_COVERAGE_MIN,
-            detail={"from": current, "to": next_value},
-            cost=self._cost(RELAX_LOWER_COVERAGE_MIN),
-            priority=4
-        )
+            current = scenario[section][field]
+            if kind == RELAX_LOWER_MIN_YEARS:
+                if current is None:
+                    requirements = (
+                        self.job_data.get("requirements", {}) if isinstance(self.job_data, dict) else {}
+                    )
+                    current = requirements.get("minimum_years_experience") or 0
+            else:
+                current = current or 0.0
+
+            if direction > 0:
+                if scenario["evaluation"]["match_mode"] != "partial_ok":
+                    continue
+                if constraint.max_value is None:
+                    continue
+                next_value = min(current + constraint.step, constraint.max_value)
+                if next_value <= current:
+                    continue
+            else:
+                min_value = constraint.min_value if constraint.min_value is not None else 0
+                next_value = current - constraint.step
+                if next_value < min_value:
+                    continue
 
-    def _lower_threshold_action(
-        self,
-        scenario: Dict[str, Any]
-    ) -> Optional[RelaxationAction]:
-        constraint = self.config.constraints.overall_score_threshold
-        if constraint.step is None:
-            return None
-        current = scenario["optimization"]["overall_score_threshold"] or 0.0
-        min_value = constraint.min_value if constraint.min_value is not None else 0.0
-        next_value = current - constraint.step
-        if next_value < min_value:
-            return None
-        return RelaxationAction(
-            kind=RELAX_LOWER_THRESHOLD,
-            detail={"from": current, "to": next_value},
-            cost=self._cost(RELAX_LOWER_THRESHOLD),
-            priority=4
-        )
+            actions.append(
+                RelaxationAction(
+                    kind=kind,
+                    detail={"from": current, "to": cast(next_value)},
+                    cost=self._cost(kind),
+                    priority=4
+                )
+            )
+        return actions
 
     def _weights_override_actions(
         self,
@@ -287,6 +259,7 @@ class RelaxationSpace:
     ) -> List[RelaxationAction]:
         options = self.config.constraints.weights_override_options or []
         current = scenario["evaluation"].get("weights_override")
+        cost = self._cost(RELAX_WEIGHTS_OVERRIDE)
         actions = []
         for option in options:
             if option == current:
@@ -295,7 +268,7 @@ class RelaxationSpace:
                 RelaxationAction(
                     kind=RELAX_WEIGHTS_OVERRIDE,
                     detail={"weights": option},
-                    cost=self._cost(RELAX_WEIGHTS_OVERRIDE),
+                    cost=cost,
                     priority=5
                 )
             )
@@ -311,10 +284,10 @@ class RelaxationSpace:
         return float(self.config.costs.get(kind, 1.0))
 
 
-def _count_skill_changes(changes: List[RelaxationChange]) -> Dict[str, int]:
+def _count_skill_changes(changes: Iterable[RelaxationChange]) -> Dict[str, int]:
     count = 0
     for change in changes:
-        if change.kind in (RELAX_REMOVE_NICE, RELAX_REMOVE_MUST, RELAX_DEMOTE_MUST):
+        if change.kind in _SKILL_RELAXATIONS:
             count += 1
     return {"skills": count}
 
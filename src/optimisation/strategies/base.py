@@ -1,7 +1,21 @@
 """Strategy base interface."""
 from typing import Callable, List, Protocol
 
-from src.optimisation.models import OptimisationConfig, OptimisationResult
+from src.optimisation.models import (
+    ChangeNode,
+    OptimisationConfig,
+    OptimisationResult,
+    iter_changes,
+    materialise_changes
+)
+
+__all__ = [
+    "ChangeNode",
+    "OptimisationStrategy",
+    "SearchContext",
+    "iter_changes",
+    "materialise_changes"
+]
 
 
 class OptimisationStrategy(Protocol):
@@ -26,3 +40,4 @@ class SearchContext:
         self.target_count = target_count
         self.ranker = ranker
         self.baseline_scenario = baseline_scenario
+
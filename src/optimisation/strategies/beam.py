@@ -3,13 +3,16 @@ from dataclasses import dataclass
 from typing import List
 
 from src.optimisation.models import RelaxationChange, OptimisationResult
-from src.optimisation.strategies.base import SearchContext
+from src.optimisation.strategies.base import ChangeNode, SearchContext, iter_changes
 
 
 @dataclass
 class _BeamPlan:
+    __slots__ = ("scenario", "key", "changes_head", "cost", "result")
+
     scenario: dict
-    changes: List[RelaxationChange]
+    key: tuple
+    changes_head: ChangeNode
     cost: float
     result: OptimisationResult
 
@@ -30,44 +33,54 @@ class BeamStrategy:
 
         baseline_result = evaluator.make_result(
             context.baseline_scenario,
-            [],
+            None,
             0.0
         )
         all_results = [baseline_result]
 
+        baseline_key = evaluator.key_for(context.baseline_scenario)
         beam = [
             _BeamPlan(
                 scenario=context.baseline_scenario,
-                changes=[],
+                key=baseline_key,
+                changes_head=None,
                 cost=0.0,
                 result=baseline_result
             )
         ]
-        visited = {evaluator.key_for(context.baseline_scenario)}
+        visited = {baseline_key}
 
         for _ in range(config.constraints.max_total_changes):
             candidates: List[_BeamPlan] = []
             for plan in beam:
-                actions = space.list_actions(plan.scenario, plan.changes)
+                actions = space.list_actions(plan.scenario, iter_changes(plan.changes_head))
                 for action in actions:
-                    new_scenario = space.apply_action(plan.scenario, action)
-                    key = evaluator.key_for(new_scenario)
+                    # Derive the key before copying so duplicates cost nothing.
+                    key = evaluator.key_after(plan.key, action)
                     if key in visited:
                         continue
                     visited.add(key)
-                    new_changes = plan.changes + [
+                    new_scenario = space.apply_action(plan.scenario, action)
+                    new_head = (
                         RelaxationChange(
                             kind=action.kind,
                             detail=action.detail,
                             cost=action.cost
-                        )
-                    ]
+                        ),
+                        plan.changes_head
+                    )
                     new_cost = plan.cost + action.cost
-                    result = evaluator.make_result(new_scenario, new_changes, new_cost)
+                    result = evaluator.make_result(
+                        new_scenario,
+                        new_head,
+                        new_cost,
+                        key
+                    )
                     candidates.append(
                         _BeamPlan(
                             scenario=new_scenario,
-                            changes=new_changes,
+                            key=key,
+                            changes_head=new_head,
                             cost=new_cost,
                             result=result
                         )
@@ -3,14 +3,17 @@ from dataclasses import dataclass
 from typing import List
 
 from src.optimisation.models import RelaxationChange, OptimisationResult
-from src.optimisation.strategies.base import SearchContext
+from src.optimisation.strategies.base import ChangeNode, SearchContext, iter_changes
 
 
 @dataclass
 class _Plan:
+    __slots__ = ("scenario", "changes_head", "cost", "result")
+
     scenario: dict
-    changes: List[RelaxationChange]
+    changes_head: ChangeNode
     cost: float
+    result: OptimisationResult
 
 
 class GreedyStrategy:
@@ -23,39 +26,44 @@ class GreedyStrategy:
         config = context.config
         target = context.target_count
 
+        baseline_result = evaluator.make_result(context.baseline_scenario, None, 0.0)
         plan = _Plan(
             scenario=context.baseline_scenario,
-            changes=[],
-            cost=0.0
+            changes_head=None,
+            cost=0.0,
+            result=baseline_result
         )
-        results: List[OptimisationResult] = [
-            evaluator.make_result(plan.scenario, plan.changes, plan.cost)
-        ]
+        results: List[OptimisationResult] = [baseline_result]
 
         max_changes = config.constraints.max_total_changes
         for _ in range(max_changes):
-            actions = space.list_actions(plan.scenario, plan.changes)
+            actions = space.list_actions(plan.scenario, iter_changes(plan.changes_head))
             if not actions:
                 break
 
             candidates = []
             for action in actions:
                 new_scenario = space.apply_action(plan.scenario, action)
-                new_changes = plan.changes + [
+                new_head = (
                     RelaxationChange(
                         kind=action.kind,
                         detail=action.detail,
                         cost=action.cost
-                    )
-                ]
+                    ),
+                    plan.changes_head
+                )
                 new_cost = plan.cost + action.cost
-                result = evaluator.make_result(new_scenario, new_changes, new_cost)
-                candidates.append((result, new_scenario, new_changes, new_cost))
+                result = evaluator.make_result(
+                    new_scenario,
+                    new_head,
+                    new_cost
+                )
+                candidates.append((result, new_scenario, new_head, new_cost))
 
             candidates.sort(key=lambda item: context.ranker(item[0], target))
-            best_result, best_scenario, best_changes, best_cost = candidates[0]
+            best_result, best_scenario, best_head, best_cost = candidates[0]
 
-            plan = _Plan(best_scenario, best_changes, best_cost)
+            plan = _Plan(best_scenario, best_head, best_cost, best_result)
             results.append(best_result)
 
             if best_result.candidate_count >= target:
@@ -1,16 +1,25 @@
 """Monte Carlo optimisation strategy."""
 import random
+from bisect import bisect
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from typing import List
 
 from src.optimisation.models import RelaxationChange, OptimisationResult
-from src.optimisation.strategies.base import SearchContext
+from src.optimisation.strategies.base import (
+    ChangeNode,
+    SearchContext,
+    iter_changes
+)
 
 
 @dataclass
 class _RunPlan:
+    __slots__ = ("scenario", "changes_head", "cost")
+
     scenario: dict
-    changes: List[RelaxationChange]
+    changes_head: ChangeNode
     cost: float
 
 
@@ -32,7 +41,7 @@ class MonteCarloStrategy:
         results: List[OptimisationResult] = []
         baseline_result = evaluator.make_result(
             context.baseline_scenario,
-            [],
+            None,
             0.0
         )
         results.append(baseline_result)
@@ -42,20 +51,22 @@ class MonteCarloStrategy:
         for _ in range(max_runs):
             plan = _RunPlan(
                 scenario=context.baseline_scenario,
-                changes=[],
+                changes_head=None,
                 cost=0.0
             )
             steps = rng.randint(1, config.constraints.max_total_changes)
 
             for _ in range(steps):
-                actions = space.list_actions(plan.scenario, plan.changes)
+                actions = space.list_actions(plan.scenario, iter_changes(plan.changes_head))
                 if not actions:
                     break
                 action = _weighted_pick(actions, rng)
                 plan = _RunPlan(
                     scenario=space.apply_action(plan.scenario, action),
-                    changes=plan.changes
-                    + [RelaxationChange(kind=action.kind, detail=action.detail, cost=action.cost)],
+                    changes_head=(
+                        RelaxationChange(kind=action.kind, detail=action.detail, cost=action.cost),
+                        plan.changes_head
+                    ),
                     cost=plan.cost + action.cost
                 )
 
@@ -64,15 +75,24 @@ class MonteCarloStrategy:
                 continue
             visited.add(key)
 
-            result = evaluator.make_result(plan.scenario, plan.changes, plan.cost)
+            result = evaluator.make_result(
+                plan.scenario,
+                plan.changes_head,
+                plan.cost,
+                key
+            )
             results.append(result)
 
         return results
 
 
 def _weighted_pick(actions, rng: random.Random):
-    weights = []
-    for action in actions:
-        weight = 1.0 / (1.0 + float(action.priority))
-        weights.append(weight)
-    return rng.choices(actions, weights=weights, k=1)[0]
+    # Same draw as rng.choices(actions, weights=...), without rebuilding the
+    # weight list and re-validating it on every step.
+    cum_weights = list(accumulate(_priority_weight(action.priority) for action in actions))
+    return actions[bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(actions) - 1)]
+
+
+@lru_cache(maxsize=None)
+def _priority_weight(priority: int) -> float:
+    return 1.0 / (1.0 + float(priority))
@@ -0,0 +1,267 @@
+"""Shared file handling and LLM parsing for the document parsers."""
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+
+from src.config import Config
+from src.parsers.cache import parse_cache, parse_cache_key, parse_cache_prefix
+from src.parsers.extraction import extract_text, split_budget
+
+MAX_EXTRACTION_WORKERS = 8
+# Concurrent LLM calls per parse_files run; kept low to respect provider rate limits.
+MAX_LLM_WORKERS = 8
+TRUNCATION_MARKER = "\n...[TRUNCATED]...\n"
+
+# Per parser class digest of the static prompt parts (kind, schema, system prompt).
+_CACHE_PREFIXES: Dict[type, Any] = {}
+
+
+def batch_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a document schema so one response can carry several documents."""
+    return {
+        "type": "object",
+        "properties": {
+            "documents": {"type": "array", "items": schema}
+        },
+        "required": ["documents"]
+    }
+
+
+def clip_text(text: str, max_chars: int) -> str:
+    """Keep the head and tail of text that exceeds max_chars."""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+
+    head, tail = split_budget(max_chars)
+    logger.warning(f"Clipping document text from {len(text)} to {max_chars} characters")
+    return f"{text[:head]}{TRUNCATION_MARKER}{text[-tail:]}"
+
+
+class DocumentParser(ABC):
+    """Base class for parsers that turn document files into structured data."""
+
+    document_label = "document"
+    document_heading = "Document"
+    cache_kind = "document"
+    function_name = "parse_document"
+    schema: Dict[str, Any] = {}
+    batch_schema: Dict[str, Any] = {}
+    system_prompt = ""
+
+    def parse_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Parse a file and return structured data.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Dictionary with structured data
+        """
+        text = self._extract_text(Path(file_path))
+        return self._parse_text(text)
+
+    def parse_files(self, file_paths: List[str], batch_size: int = 4) -> List[Dict[str, Any]]:
+        """
+        Parse several files, sending up to batch_size documents per LLM call.
+
+        Batches are sent concurrently so their network round trips overlap.
+
+        Args:
+            file_paths: Paths to the files
+            batch_size: Maximum number of documents per LLM call
+
+        Returns:
+            Structured data for each file, in the same order as file_paths
+        """
+        texts = self.extract_texts(file_paths)
+        batch_size = max(1, batch_size)
+
+        batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+        if len(batches) < 2:
+            return [result for batch in batches for result in self._parse_batch(batch)]
+
+        max_workers = min(MAX_LLM_WORKERS, len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = list(executor.map(self._parse_batch, batches))
+        return [result for batch in parsed for result in batch]
+
+    def extract_texts(self, file_paths: List[str]) -> List[str]:
+        """
+        Extract text from several files, using a process pool when there is more than one.
+
+        Args:
+            file_paths: Paths to the files
+
+        Returns:
+            Extracted text for each file, in the same order as file_paths
+        """
+        paths = [Path(file_path) for file_path in file_paths]
+        if len(paths) < 2:
+            return [self._extract_text(path) for path in paths]
+
+        for path in paths:
+            self._check_file(path)
+
+        max_workers = min(os.cpu_count() or 1, MAX_EXTRACTION_WORKERS, len(paths))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            texts = list(executor.map(extract_text, paths))
+
+        logger.info(f"Extracted text from {len(texts)} {self.document_label} files")
+        return texts
+
+    def _check_file(self, file_path: Path) -> None:
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        file_extension = file_path.suffix.lower()
+        logger.info(f"Parsing {self.document_label}: {file_path.name} (type: {file_extension})")
+
+    def _extract_text(self, file_path: Path) -> str:
+        self._check_file(file_path)
+        text = extract_text(file_path)
+        logger.info(f"Extracted {len(text)} characters from {self.document_label}")
+        return text
+
+    @abstractmethod
+    def _model(self) -> str:
+        """Return the LLM model used to parse this document type."""
+
+    @abstractmethod
+    def _fallback_result(self, text: str) -> Dict[str, Any]:
+        """Return the stub structure used when the LLM is skipped or fails."""
+
+    def _build_prompt(self, text: str) -> str:
+        return f"{self.document_heading}:\n{text}"
+
+    def _build_batch_prompt(self, texts: List[str]) -> str:
+        documents = "\n\n".join(
+            f"{self.document_heading} {index}:\n{text}"
+            for index, text in enumerate(texts, start=1)
+        )
+        return f"""Extract structured data for each numbered document below. Return exactly {len(texts)} entries in "documents", in the same order as the documents.
+
+{documents}"""
+
+    def _is_too_short(self, text: str) -> bool:
+        length = len(text.strip())
+        if length >= Config.PARSE_MIN_INPUT_CHARS:
+            return False
+        logger.info(f"Skipping LLM parse of {self.document_label} with only {length} characters; using stub")
+        return True
+
+    def _cache_key(self, prompt: str) -> str:
+        prefix = _CACHE_PREFIXES.get(type(self))
+        if prefix is None:
+            prefix = parse_cache_prefix(self.cache_kind, self.schema, self.system_prompt)
+            _CACHE_PREFIXES[type(self)] = prefix
+        return parse_cache_key(prefix, self._model(), prompt)
+
+    def _prepare(self, text: str) -> Tuple[Optional[Dict[str, Any]], str, str]:
+        """
+        Clip text and look for a result that needs no LLM call.
+
+        Returns:
+            (stub or cached result or None, clipped text, parse cache key or ""
+            when the cache is off)
+        """
+        if self._is_too_short(text):
+            return self._fallback_result(text), text, ""
+
+        text = clip_text(text, Config.PARSE_MAX_INPUT_CHARS)
+        if not parse_cache.enabled:
+            return None, text, ""
+        cache_key = self._cache_key(self._build_prompt(text))
+        cached = parse_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached {self.document_label} parse")
+        return cached, text, cache_key
+
+    def _parse_text(self, text: str) -> Dict[str, Any]:
+        """
+        Use LLM to parse document text into structured data.
+
+        Args:
+            text: Raw document text
+
+        Returns:
+            Dictionary with structured data
+        """
+        ready, text, cache_key = self._prepare(text)
+        if ready is not None:
+            return ready
+        return self._parse_prepared(text, cache_key)
+
+    def _parse_prepared(self, text: str, cache_key: str) -> Dict[str, Any]:
+        """Parse text that _prepare has already clipped and keyed."""
+        from src.matching.matcher import get_llm_client
+
+        llm_client = get_llm_client(self._model())
+
+        try:
+            data = llm_client.call_llm(
+                self._build_prompt(text),
+                temperature=0.3,
+                context=f"{self.cache_kind} parsing",
+                schema=self.schema,
+                function_name=self.function_name,
+                system=self.system_prompt
+            )
+
+            if not isinstance(data, dict):
+                raise ValueError("LLM response was not a JSON object.")
+
+            parse_cache.set(cache_key, data)
+
+            logger.info(f"Successfully parsed {self.document_label} into structured format")
+            return data
+        except Exception as e:
+            logger.error(f"Failed to parse LLM response as structured data: {e}")
+            return self._fallback_result(text)
+
+    def _parse_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        from src.matching.matcher import get_llm_client
+
+        results: List[Any] = [None] * len(texts)
+        pending = []
+        for index, text in enumerate(texts):
+            ready, text, cache_key = self._prepare(text)
+            if ready is not None:
+                results[index] = ready
+            else:
+                pending.append((index, text, cache_key))
+
+        if len(pending) == 1:
+            index, text, cache_key = pending[0]
+            results[index] = self._parse_prepared(text, cache_key)
+        elif pending:
+            llm_client = get_llm_client(self._model())
+            try:
+                data = llm_client.call_llm(
+                    self._build_batch_prompt([text for _, text, _ in pending]),
+                    temperature=0.3,
+                    max_tokens=4000 * len(pending),
+                    context=f"{self.cache_kind} batch parsing",
+                    schema=self.batch_schema,
+                    function_name=f"{self.function_name}_batch",
+                    system=self.system_prompt
+                )
+                documents = data.get("documents") if isinstance(data, dict) else None
+                if not isinstance(documents, list) or len(documents) != len(pending):
+                    raise ValueError(f"Expected {len(pending)} documents in batch response.")
+                if not all(isinstance(document, dict) for document in documents):
+                    raise ValueError("Batch response contained a non-object document.")
+            except Exception as e:
+                logger.warning(f"Batch parse failed, parsing documents one at a time: {e}")
+                for index, text, cache_key in pending:
+                    results[index] = self._parse_prepared(text, cache_key)
+            else:
+                for (index, _, cache_key), document in zip(pending, documents):
+                    parse_cache.set(cache_key, document)
+                    results[index] = document
+                logger.info(f"Parsed {len(pending)} {self.document_label} documents in one call")
+
+        return results
@@ -0,0 +1,137 @@
+"""On-disk caches for extracted document text and LLM parse results."""
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from src.config import Config
+from src.utils import fast_json
+
+# Bump when parsing or extraction changes in a way the keys do not capture, so
+# entries written by older code are no longer read.
+CACHE_VERSION = "1"
+
+
+def parse_cache_prefix(kind: str, schema: Dict[str, Any], system: str) -> Any:
+    """Hash the static part of a parser's prompt once; keys extend a copy of it."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (CACHE_VERSION, kind, fast_json.dumps(schema, sort_keys=True), system):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest
+
+
+def parse_cache_key(prefix: Any, model: str, prompt: str) -> str:
+    """Hash everything that determines a parse result into a cache key."""
+    digest = prefix.copy()
+    for part in (Config.LLM_PROVIDER, model or "", prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Store structured parse results as one JSON file per key."""
+
+    suffix = ".json"
+    subdirectory = ""
+    memory_size = 256
+
+    def __init__(self, directory: Optional[str] = None):
+        self._directory = directory
+        # Recently used entries, so repeat lookups in one process skip the disk.
+        self._memory: "OrderedDict[Tuple[Path, str], Any]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return Config.PARSE_CACHE_ENABLED
+
+    @property
+    def directory(self) -> Path:
+        return Path(self._directory or Config.PARSE_CACHE_DIR).expanduser() / self.subdirectory
+
+    def _load(self, handle) -> Any:
+        return fast_json.loads(handle.read())
+
+    def _dump(self, value: Any, handle) -> None:
+        handle.write(fast_json.dumps(value))
+
+    def _recall(self, memory_key: Tuple[Path, str]) -> Optional[Any]:
+        with self._memory_lock:
+            value = self._memory.get(memory_key)
+            if value is not None:
+                self._memory.move_to_end(memory_key)
+            return value
+
+    def _remember(self, memory_key: Tuple[Path, str], value: Any) -> None:
+        with self._memory_lock:
+            self._memory[memory_key] = value
+            self._memory.move_to_end(memory_key)
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        directory = self.directory
+        memory_key = (directory, key)
+        remembered = self._recall(memory_key)
+        if remembered is not None:
+            return copy.deepcopy(remembered)
+
+        path = directory / f"{key}{self.suffix}"
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as handle:
+                value = self._load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {path.name}: {e}")
+            return None
+        self._remember(memory_key, value)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled or not key:
+            return
+        directory = self.directory
+        path = directory / f"{key}{self.suffix}"
+        tmp_path = directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8", newline="") as handle:
+                self._dump(value, handle)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write parse cache entry {path.name}: {e}")
+        self._remember((directory, key), copy.deepcopy(value))
+
+
+class TextCache(ParseCache):
+    """Store text extracted from PDF and DOCX files, keyed by file identity."""
+
+    suffix = ".txt"
+    subdirectory = "text"
+
+    def _load(self, handle) -> str:
+        return handle.read()
+
+    def _dump(self, value: str, handle) -> None:
+        handle.write(value)
+
+
+def text_cache_key(file_path: Path, max_chars: int) -> str:
+    """Key extracted text by the file's location, size, modification time and text budget."""
+    stat = file_path.stat()
+    identity = f"{CACHE_VERSION}\0{file_path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}\0{max_chars}"
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+
+parse_cache = ParseCache()
+text_cache = TextCache()
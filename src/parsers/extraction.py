@@ -0,0 +1,210 @@
+"""Shared text extraction helpers for the document parsers."""
+import logging
+import mmap
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from loguru import logger
+
+from src.config import Config
+from src.parsers.cache import text_cache, text_cache_key
+
+# PyPDF2 can log per object on malformed files; if the host app lowers the root
+# level that logging alone can slow extraction noticeably.
+logging.getLogger("PyPDF2").setLevel(logging.WARNING)
+
+# The PDF and DOCX libraries are imported on first use so that parsing text
+# files, or importing the CLI, does not pay for loading them.
+
+
+@lru_cache(maxsize=None)
+def _load_fitz():
+    try:
+        import fitz
+    except ImportError:  # PyMuPDF is an optional extra; pypdfium2 is the default.
+        return None
+    return fitz
+
+
+@lru_cache(maxsize=None)
+def _load_pdfium():
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    return pypdfium2
+
+
+def split_budget(max_chars: int) -> Tuple[int, int]:
+    """Split a character budget into the head and tail that clipping keeps."""
+    head = max_chars * 3 // 4
+    return head, max_chars - head
+
+
+def _join_pages(page_count: int, read_page: Callable[[int], Optional[str]], max_chars: int) -> str:
+    """Join page text, skipping middle pages that clipping would drop anyway.
+
+    Pages are read from the front until the head budget is covered, then from
+    the back until the tail budget is, so clipping the result gives the same
+    text as clipping the whole document.
+    """
+    if max_chars <= 0:
+        return "\n".join(filter(None, map(read_page, range(page_count)))).strip()
+
+    head_budget, tail_budget = split_budget(max_chars)
+
+    front = []
+    next_index = 0
+    while next_index < page_count:
+        page_text = read_page(next_index)
+        next_index += 1
+        if page_text:
+            front.append(page_text)
+            if len("\n".join(front).lstrip()) >= head_budget:
+                break
+
+    back = []
+    last_index = page_count - 1
+    while last_index >= next_index:
+        page_text = read_page(last_index)
+        last_index -= 1
+        if page_text:
+            back.append(page_text)
+            if len("\n".join(reversed(back)).rstrip()) >= tail_budget:
+                break
+
+    skipped = last_index - next_index + 1
+    if skipped > 0:
+        logger.info(
+            f"Skipped {skipped} of {page_count} PDF pages beyond the "
+            f"{max_chars}-character parse budget"
+        )
+
+    back.reverse()
+    return "\n".join(front + back).strip()
+
+
+# Pages are read serially on purpose: neither MuPDF nor PDFium may be used from
+# several threads, and files are already spread across processes by
+# DocumentParser.extract_texts.
+def _extract_with_fitz(fitz, file_path: Path, max_chars: int) -> str:
+    with fitz.open(str(file_path)) as doc:
+        return _join_pages(doc.page_count, lambda index: doc[index].get_text("text"), max_chars)
+
+
+def _extract_with_pdfium(pdfium, file_path: Path, max_chars: int) -> str:
+    pdf = pdfium.PdfDocument(str(file_path))
+    try:
+        def read_page(index: int) -> str:
+            return pdf[index].get_textpage().get_text_range().replace('\r\n', '\n')
+
+        return _join_pages(len(pdf), read_page, max_chars)
+    finally:
+        pdf.close()
+
+
+def _extract_with_pypdf2(file_path: Path, max_chars: int) -> str:
+    import PyPDF2
+
+    with open(file_path, 'rb') as file:
+        pages = PyPDF2.PdfReader(file).pages
+        return _join_pages(len(pages), lambda index: pages[index].extract_text(), max_chars)
+
+
+def extract_text_from_pdf(file_path: Path, max_chars: Optional[int] = None) -> str:
+    """Extract text from PDF file, trying PyMuPDF, pypdfium2, then PyPDF2."""
+    if max_chars is None:
+        max_chars = Config.PARSE_MAX_INPUT_CHARS
+
+    # A backend that finds no text may simply not cope with this file, so an
+    # empty result also falls through to the next one.
+    fitz = _load_fitz()
+    if fitz is not None:
+        try:
+            text = _extract_with_fitz(fitz, file_path, max_chars)
+            if text:
+                return text
+            logger.warning("PyMuPDF found no text, trying pypdfium2")
+        except Exception as e:
+            logger.warning(f"PyMuPDF failed, trying pypdfium2: {e}")
+
+    pdfium = _load_pdfium()
+    if pdfium is not None:
+        try:
+            text = _extract_with_pdfium(pdfium, file_path, max_chars)
+            if text:
+                return text
+            logger.warning("pypdfium2 found no text, trying PyPDF2")
+        except Exception as e:
+            logger.warning(f"pypdfium2 failed, trying PyPDF2: {e}")
+
+    try:
+        return _extract_with_pypdf2(file_path, max_chars)
+    except Exception as e:
+        logger.error(f"Failed to extract text from PDF: {e}")
+        raise
+
+
+def extract_text_from_docx(file_path: Path) -> str:
+    """Extract text from DOCX file."""
+    from docx import Document
+
+    doc = Document(file_path)
+    paragraphs = (paragraph.text for paragraph in doc.paragraphs)
+    text = "\n".join(paragraph for paragraph in paragraphs if paragraph)
+    return text.strip()
+
+
+def extract_text_from_text(file_path: Path) -> str:
+    """Extract text from TXT or MD file."""
+    # Parsing keeps only the head and tail of long documents (see clip_text), and
+    # no character can take more than 4 bytes, so huge files only decode a window
+    # from each end.
+    window = 4 * Config.PARSE_MAX_INPUT_CHARS
+    if window <= 0 or os.path.getsize(file_path) <= 2 * window:
+        return _decode_bytes(file_path.read_bytes()).lstrip('\ufeff').strip()
+
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            head = _decode_bytes(mapped[:window]).lstrip('\ufeff')
+            tail = _decode_bytes(mapped[-window:])
+    return f"{head.lstrip()}\n{tail.rstrip()}"
+
+
+def _decode_bytes(data: bytes) -> str:
+    # Stray bytes in an upload should not fail the parse, and a window edge may
+    # split a character; either way the bytes are replaced rather than raising.
+    text = data.decode('utf-8', errors='replace')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+_EXTRACTORS: Dict[str, Callable[[Path], str]] = {
+    '.pdf': extract_text_from_pdf,
+    '.docx': extract_text_from_docx,
+    '.txt': extract_text_from_text,
+    '.md': extract_text_from_text,
+}
+
+# PDF and DOCX extraction is slow and deterministic for unchanged files.
+_CACHED_EXTENSIONS = frozenset({'.pdf', '.docx'})
+
+
+def extract_text(file_path: Path) -> str:
+    """Extract text from a supported document based on its extension.
+
+    Kept at module level so it can be shipped to worker processes.
+    """
+    file_extension = file_path.suffix.lower()
+    extractor = _EXTRACTORS.get(file_extension)
+    if extractor is None:
+        raise ValueError(f"Unsupported file type: {file_extension}")
+    if file_extension not in _CACHED_EXTENSIONS or not text_cache.enabled:
+        return extractor(file_path)
+
+    cache_key = text_cache_key(file_path, Config.PARSE_MAX_INPUT_CHARS)
+    text = text_cache.get(cache_key)
+    if text is None:
+        text = extractor(file_path)
+        text_cache.set(cache_key, text)
+    return text
@@ -1,12 +1,10 @@
 """Resume parser - extracts resume data into JSON Resume format."""
-from pathlib import Path
 from typing import Dict, Any
-import PyPDF2
-import pdfplumber
-from docx import Document
-from loguru import logger
 
 from src.config import Config
+from src.parsers.base import DocumentParser, batch_schema
+
+__all__ = ["ResumeParser", "RESUME_SCHEMA"]
 
 RESUME_SCHEMA = {
     "type": "object",
@@ -212,105 +210,9 @@ RESUME_SCHEMA = {
 }
 
 
-class ResumeParser:
-    """Parse resume files into JSON Resume format (jsonresume.org)."""
-    
-    def __init__(self):
-        """Initialize the resume parser."""
-        pass
-    
-    def parse_file(self, file_path: str) -> Dict[str, Any]:
-        """
-        Parse a resume file and return structured data in JSON Resume format.
-        
-        Args:
-            file_path: Path to the resume file
-            
-        Returns:
-            Dictionary in JSON Resume format
-        """
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        file_extension = file_path.suffix.lower()
-        logger.info(f"Parsing resume: {file_path.name} (type: {file_extension})")
-        
-        # Extract text based on file type
-        if file_extension == '.pdf':
-            text = self._extract_text_from_pdf(file_path)
-        elif file_extension == '.docx':
-            text = self._extract_text_from_docx(file_path)
-        elif file_extension in ['.txt', '.md']:
-            text = self._extract_text_from_text(file_path)
-        else:
-            raise ValueError(f"Unsupported file type: {file_extension}")
-        
-        logger.info(f"Extracted {len(text)} characters from resume")
-        
-        # Use LLM to parse text into JSON Resume format
-        resume_data = self._parse_text_to_json_resume(text)
-        
-        return resume_data
-    
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
-        """Extract text from PDF file."""
-        text = ""
-        
-        try:
-            # Try pdfplumber first (better text extraction)
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            logger.warning(f"pdfplumber failed, trying PyPDF2: {e}")
-            # Fallback to PyPDF2
-            try:
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-            except Exception as e2:
-                logger.error(f"Failed to extract text from PDF: {e2}")
-                raise
-        
-        return text.strip()
-    
-    def _extract_text_from_docx(self, file_path: Path) -> str:
-        """Extract text from DOCX file."""
-        doc = Document(file_path)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text.strip()
-    
-    def _extract_text_from_text(self, file_path: Path) -> str:
-        """Extract text from TXT or MD file."""
-        with open(file_path, 'r', encoding='utf-8') as file:
-            text = file.read()
-        return text.strip()
-    
-    def _parse_text_to_json_resume(self, text: str) -> Dict[str, Any]:
-        """
-        Use LLM to parse resume text into JSON Resume format.
-        
-        Args:
-            text: Raw resume text
-            
-        Returns:
-            Dictionary in JSON Resume format
-        """
-        from src.matching.matcher import LLMClient
-        
-        llm_client = LLMClient(model=Config.RESUME_MODEL)
-        
-        prompt = f"""You are a resume parsing assistant. Extract facts from the resume text and format them according to the JSON Resume schema (jsonresume.org).
+RESUME_BATCH_SCHEMA = batch_schema(RESUME_SCHEMA)
 
-Resume Text:
-{text}
+_RESUME_SYSTEM_PROMPT = """You are a resume parsing assistant. Extract facts from the resume text and format them according to the JSON Resume schema (jsonresume.org).
 
 Extraction rules:
 - Use only information explicitly stated; do not infer or assume.
@@ -322,31 +224,30 @@ Extraction rules:
 
 Return data using the structured output schema."""
 
-        try:
-            resume_data = llm_client.call_llm(
-                prompt,
-                temperature=0.3,
-                context="resume parsing",
-                schema=RESUME_SCHEMA,
-                function_name="parse_resume"
-            )
 
-            if not isinstance(resume_data, dict):
-                raise ValueError("LLM response was not a JSON object.")
+class ResumeParser(DocumentParser):
+    """Parse resume files into JSON Resume format (jsonresume.org)."""
 
-            logger.info("Successfully parsed resume into JSON Resume format")
-            return resume_data
-        except Exception as e:
-            logger.error(f"Failed to parse LLM response as structured data: {e}")
-            
-            # Return a minimal valid JSON Resume structure
-            return {
-                "basics": {
-                    "name": "Unknown",
-                    "email": None,
-                    "summary": text[:500]  # Use first 500 chars as fallback
-                },
-                "work": [],
-                "education": [],
-                "skills": []
-            }
+    document_label = "resume"
+    document_heading = "Resume Text"
+    cache_kind = "resume"
+    function_name = "parse_resume"
+    schema = RESUME_SCHEMA
+    batch_schema = RESUME_BATCH_SCHEMA
+    system_prompt = _RESUME_SYSTEM_PROMPT
+
+    def _model(self) -> str:
+        return Config.RESUME_MODEL
+
+    def _fallback_result(self, text: str) -> Dict[str, Any]:
+        # Return a minimal valid structure
+        return {
+            "basics": {
+                "name": "Unknown",
+                "email": None,
+                "summary": text[:500]  # Use first 500 chars as fallback
+            },
+            "work": [],
+            "education": [],
+            "skills": []
+        }
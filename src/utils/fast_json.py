@@ -0,0 +1,27 @@
+"""JSON encoding that uses orjson when it is installed."""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up; fall back to the standard library.
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON; errors are json.JSONDecodeError with either backend."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Encode JSON to a str, optionally indented by two spaces and key-sorted."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, option=option).decode("utf-8")
+    return json.dumps(value, indent=2 if indent else None, sort_keys=sort_keys)
@@ -1,5 +1,7 @@
 """Deterministic what-if evaluation rules."""
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from src.what_if.scenario import ScenarioValidationError, apply_skill_edits
 
@@ -11,21 +13,44 @@ DEFAULT_WEIGHTS = {
     "education": 15.0
 }
 
+# (legacy_mode, full matches, partial matches) per match_data bucket, keyed by
+# the bucket's id. Owners must keep the applications alive while they use it.
+MatchSets = Dict[int, Tuple[bool, FrozenSet[str], FrozenSet[str]]]
+
 
 def evaluate_applications(
     applications: List[Any],
     job_data: Dict[str, Any],
     scenario: Dict[str, Any],
     include_details: bool = False,
-    include_summary_table: bool = False
+    include_summary_table: bool = False,
+    match_sets: Optional[MatchSets] = None
 ) -> Dict[str, Any]:
-    """Evaluate a scenario across a list of applications."""
+    """Evaluate a scenario across a list of applications.
+
+    match_sets caches each application's skill sets; pass the same dict when
+    scoring the same applications under many scenarios.
+    """
+    if not applications:
+        return _empty_evaluation(include_details, include_summary_table)
+
     warnings: List[str] = []
     results: List[Dict[str, Any]] = []
-    scores: List[float] = []
+    score_total = 0.0
+    min_score = max_score = None
+    passed_count = 0
     summary_table: List[Dict[str, Any]] = []
 
-    effective_requirements = apply_skill_edits(job_data, scenario)
+    # The requirement lists are the same for every application; freeze them once.
+    effective = apply_skill_edits(job_data, scenario)
+    effective_requirements = {
+        "must_have": tuple(effective["must_have"]),
+        "nice_to_have": tuple(effective["nice_to_have"])
+    }
+    evaluation = scenario["evaluation"]
+    weights = _normalize_weights(evaluation, include_nice=evaluation["include_nice_to_have"])
+    if match_sets is None:
+        match_sets = {}
 
     for application in applications:
         candidate = getattr(application, "candidate", None)
@@ -47,10 +72,19 @@ def evaluate_applications(
             scenario,
             effective_requirements,
             warnings,
-            include_details
+            include_details,
+            weights=weights,
+            match_sets=match_sets
         )
         results.append(candidate_result)
-        scores.append(candidate_result["overall_score"])
+        score = candidate_result["overall_score"]
+        score_total += score
+        if min_score is None or score < min_score:
+            min_score = score
+        if max_score is None or score > max_score:
+            max_score = score
+        if candidate_result["passed"]:
+            passed_count += 1
 
         if include_summary_table:
             original_score = _coalesce_score(getattr(application, "overall_score", None))
@@ -73,16 +107,13 @@ def evaluate_applications(
                 }
             )
 
-    passed = [r for r in results if r["passed"]]
-    failed = [r for r in results if not r["passed"]]
-
     summary = {
         "applications_total": len(results),
-        "applications_passed": len(passed),
-        "applications_failed": len(failed),
-        "average_score": round(sum(scores) / len(scores), 1) if scores else 0.0,
-        "min_score": min(scores) if scores else 0.0,
-        "max_score": max(scores) if scores else 0.0
+        "applications_passed": passed_count,
+        "applications_failed": len(results) - passed_count,
+        "average_score": round(score_total / len(results), 1) if results else 0.0,
+        "min_score": min_score if results else 0.0,
+        "max_score": max_score if results else 0.0
     }
 
     payload = {
@@ -92,14 +123,31 @@ def evaluate_applications(
     if include_details:
         payload["candidates"] = results
     if include_summary_table:
-        summary_table.sort(
-            key=lambda row: _coalesce_score(row.get("original_score")),
-            reverse=True
-        )
+        # original_score was coalesced to a float when each row was built.
+        summary_table.sort(key=itemgetter("original_score"), reverse=True)
         payload["summary_table"] = summary_table
     return payload
 
 
+def _empty_evaluation(include_details: bool, include_summary_table: bool) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "summary": {
+            "applications_total": 0,
+            "applications_passed": 0,
+            "applications_failed": 0,
+            "average_score": 0.0,
+            "min_score": 0.0,
+            "max_score": 0.0
+        },
+        "warnings": []
+    }
+    if include_details:
+        payload["candidates"] = []
+    if include_summary_table:
+        payload["summary_table"] = []
+    return payload
+
+
 def evaluate_candidate(
     candidate_id: Any,
     candidate_name: Any,
@@ -107,13 +155,23 @@ def evaluate_candidate(
     match_data: Dict[str, Any],
     job_data: Dict[str, Any],
     scenario: Dict[str, Any],
-    effective_requirements: Dict[str, List[str]],
+    effective_requirements: Dict[str, Sequence[str]],
     warnings: List[str],
-    include_details: bool
+    include_details: bool,
+    weights: Optional[Dict[str, float]] = None,
+    match_sets: Optional[MatchSets] = None
 ) -> Tuple[Dict[str, Any], List[str]]:
-    """Score a single candidate against the scenario."""
+    """Score a single candidate against the scenario.
+
+    weights are the normalized category weights; pass them in when scoring
+    many candidates under one scenario so they are only computed once.
+    """
     evaluation = scenario["evaluation"]
     optimization = scenario["optimization"]
+    if weights is None:
+        weights = _normalize_weights(evaluation, include_nice=evaluation["include_nice_to_have"])
+    if match_sets is None:
+        match_sets = {}
 
     match_mode = evaluation["match_mode"]
     partial_weight = evaluation["partial_match_weight"]
@@ -124,7 +182,8 @@ def evaluate_candidate(
         match_mode,
         partial_weight,
         "must_have_skills",
-        warnings
+        warnings,
+        match_sets
     )
     nice_bucket = _score_requirement_bucket(
         effective_requirements["nice_to_have"],
@@ -132,7 +191,8 @@ def evaluate_candidate(
         match_mode,
         partial_weight,
         "nice_to_have_skills",
-        warnings
+        warnings,
+        match_sets
     )
 
     gate_pass = _must_have_gate_pass(
@@ -159,7 +219,7 @@ def evaluate_candidate(
         nice_bucket["score"],
         experience_score,
         education_score,
-        evaluation
+        weights
     )
 
     threshold = optimization["overall_score_threshold"]
@@ -195,27 +255,18 @@ def evaluate_candidate(
 
 
 def _score_requirement_bucket(
-    requirements: List[str],
+    requirements: Sequence[str],
     match_bucket: Dict[str, Any],
     match_mode: str,
     partial_weight: float,
     label: str,
-    warnings: List[str]
+    warnings: List[str],
+    match_sets: MatchSets
 ) -> Dict[str, Any]:
     if not isinstance(match_bucket, dict):
         raise ScenarioValidationError([f"match_data.{label} is missing or invalid."])
 
-    full_matches = match_bucket.get("full_matches")
-    partial_matches = match_bucket.get("partial_matches")
-    missing_skills = match_bucket.get("missing_skills")
-    matched_skills = match_bucket.get("matched_skills")
-
-    legacy_mode = False
-    if full_matches is None or partial_matches is None:
-        legacy_mode = True
-        full_matches = matched_skills or []
-        partial_matches = []
-        missing_skills = missing_skills or []
+    legacy_mode, full_set, partial_set = _match_sets(match_bucket, match_sets)
 
     if match_mode == "full_only" and legacy_mode:
         raise ScenarioValidationError(
@@ -227,10 +278,6 @@ def _score_requirement_bucket(
             f"{label} uses legacy matched_skills only; partials cannot be separated."
         )
 
-    full_set = set(full_matches or [])
-    partial_set = set(partial_matches or [])
-    missing_set = set(missing_skills or [])
-
     ordered_full: List[str] = []
     ordered_partial: List[str] = []
     ordered_missing: List[str] = []
@@ -269,6 +316,25 @@ def _score_requirement_bucket(
     }
 
 
+def _match_sets(
+    match_bucket: Dict[str, Any],
+    match_sets: MatchSets
+) -> Tuple[bool, FrozenSet[str], FrozenSet[str]]:
+    cached = match_sets.get(id(match_bucket))
+    if cached is not None:
+        return cached
+
+    full_matches = match_bucket.get("full_matches")
+    partial_matches = match_bucket.get("partial_matches")
+    if full_matches is None or partial_matches is None:
+        sets = (True, frozenset(match_bucket.get("matched_skills") or []), frozenset())
+    else:
+        sets = (False, frozenset(full_matches), frozenset(partial_matches))
+
+    match_sets[id(match_bucket)] = sets
+    return sets
+
+
 def _must_have_gate_pass(
     must_bucket: Dict[str, Any],
     match_mode: str,
@@ -362,9 +428,8 @@ def _score_overall(
     nice_score: float,
     experience_score: float,
     education_score: float,
-    evaluation: Dict[str, Any]
+    weights: Dict[str, float]
 ) -> float:
-    weights = _normalize_weights(evaluation, include_nice=evaluation["include_nice_to_have"])
     weighted = (
         must_score * weights["must_have"]
         + nice_score * weights["nice_to_have"]
@@ -429,6 +494,13 @@ def _extract_candidate_education(
 def _rank_degree(level: Any) -> int:
     if not isinstance(level, str):
         return 0
+    return _rank_degree_text(level)
+
+
+# Degree and field strings repeat across candidates and across the scenarios of
+# an optimisation sweep, so their keyword scans are memoized.
+@lru_cache(maxsize=1024)
+def _rank_degree_text(level: str) -> int:
     text = level.lower()
     if "phd" in text or "doctor" in text:
         return 5
@@ -446,6 +518,11 @@ def _rank_degree(level: Any) -> int:
 def _field_matches(candidate_area: str, required_field: Any) -> bool:
     if not required_field or not isinstance(required_field, str):
         return True
+    return _field_text_matches(candidate_area, required_field)
+
+
+@lru_cache(maxsize=1024)
+def _field_text_matches(candidate_area: str, required_field: str) -> bool:
     if "related" in required_field.lower():
         return bool(candidate_area)
     if not candidate_area:
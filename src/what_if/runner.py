@@ -1,7 +1,7 @@
 """Orchestration for scenario parsing and evaluation."""
 from typing import Any, Dict, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from src.database.models import Job, Application, Candidate
 from src.what_if.evaluator import evaluate_applications
@@ -45,6 +45,7 @@ def run_what_if(
     applications = (
         db.query(Application)
         .join(Candidate)
+        .options(contains_eager(Application.candidate))
         .filter(Application.job_id == job_id)
         .all()
     )
@@ -1,9 +1,11 @@
 """Scenario parsing, normalization, and shock reporting for what-if analysis."""
-import json
-from typing import Any, Dict, List, Tuple
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.config import Config
-from src.matching.matcher import LLMClient
+from src.matching.matcher import get_llm_client
+from src.utils import fast_json
 
 
 SCENARIO_PARSE_SCHEMA: Dict[str, Any] = {
@@ -104,6 +106,31 @@ DEFAULT_SCENARIO = {
 }
 
 
+def copy_scenario(scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a normalized scenario that shares no mutable state with it."""
+    # Sections hold scalars, skill blocks of lists, or a flat weights dict, so
+    # copying those levels is a full deep copy at a fraction of copy.deepcopy's cost.
+    return {
+        section: {
+            name: (
+                {
+                    key: list(item) if isinstance(item, list) else item
+                    for key, item in value.items()
+                }
+                if isinstance(value, dict)
+                else value
+            )
+            for name, value in fields.items()
+        }
+        for section, fields in scenario.items()
+    }
+
+
+def copy_default_scenario() -> Dict[str, Any]:
+    """Return a fresh, mutable copy of DEFAULT_SCENARIO."""
+    return copy_scenario(DEFAULT_SCENARIO)
+
+
 class ScenarioValidationError(ValueError):
     """Raised when a scenario is invalid."""
 
@@ -112,13 +139,7 @@ class ScenarioValidationError(ValueError):
         self.errors = errors
 
 
-def parse_scenario_text(scenario_text: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Parse a free-text scenario into structured directives using the LLM."""
-    requirements = job_data.get("requirements", {}) if isinstance(job_data, dict) else {}
-    must_have = requirements.get("must_have_skills") or []
-    nice_to_have = requirements.get("nice_to_have_skills") or []
-
-    prompt = f"""You are a strict scenario parser for a recruiter what-if tool.
+_SCENARIO_SYSTEM_PROMPT = """You are a strict scenario parser for a recruiter what-if tool.
 
 Return ONLY valid JSON that matches the provided schema. Do not add extra keys.
 
@@ -136,26 +157,38 @@ Allowed directives:
 - objective: "maximize_candidate_count"
 - overall_score_threshold: number or null
 
-If a directive is not mentioned, set it to null (or empty lists for skills).
-Use ONLY these skills when adding/removing:
-must_have_skills: {json.dumps(must_have, indent=2)}
-nice_to_have_skills: {json.dumps(nice_to_have, indent=2)}
+If a directive is not mentioned, set it to null (or empty lists for skills)."""
+
+
+def parse_scenario_text(scenario_text: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse a free-text scenario into structured directives using the LLM."""
+    prompt = f"""{_skills_prompt(job_data)}
 
 Scenario text:
 {scenario_text}
 """
 
-    llm_client = LLMClient(model=Config.DEFAULT_MODEL)
+    llm_client = get_llm_client(Config.DEFAULT_MODEL)
     return llm_client.call_llm(
         prompt,
         temperature=0.0,
         max_tokens=1500,
         context="what-if scenario parsing",
         schema=SCENARIO_PARSE_SCHEMA,
-        function_name="parse_what_if_scenario"
+        function_name="parse_what_if_scenario",
+        system=_SCENARIO_SYSTEM_PROMPT
     )
 
 
+def _skills_prompt(job_data: Dict[str, Any]) -> str:
+    requirements = job_data.get("requirements", {}) if isinstance(job_data, dict) else {}
+    must_have = requirements.get("must_have_skills") or []
+    nice_to_have = requirements.get("nice_to_have_skills") or []
+    return f"""Use ONLY these skills when adding/removing:
+must_have_skills: {fast_json.dumps(must_have, indent=True)}
+nice_to_have_skills: {fast_json.dumps(nice_to_have, indent=True)}"""
+
+
 def normalize_scenario(
     raw: Dict[str, Any],
     job_data: Dict[str, Any],
@@ -164,7 +197,7 @@ def normalize_scenario(
     """Normalize and validate a scenario payload."""
     errors: List[str] = []
     warnings: List[str] = []
-    normalized = json.loads(json.dumps(DEFAULT_SCENARIO))
+    normalized = copy_default_scenario()
 
     if not isinstance(raw, dict):
         raise ScenarioValidationError(["Scenario payload must be an object."])
@@ -203,79 +236,17 @@ def normalize_scenario(
     normalized["scenario"]["skills_add"] = add_block
     normalized["scenario"]["skills_remove"] = remove_block
 
-    match_mode = _coerce_enum(
-        evaluation_raw.get("match_mode"),
-        "match_mode",
-        ["full_only", "partial_ok", "full", "partial"],
-        errors
-    )
-    if match_mode in ("full", "partial"):
-        match_mode = "full_only" if match_mode == "full" else "partial_ok"
-    normalized["evaluation"]["match_mode"] = match_mode or normalized["evaluation"]["match_mode"]
-
-    partial_weight = _coerce_float(
-        evaluation_raw.get("partial_match_weight"),
-        "partial_match_weight",
-        errors,
-        min_value=0.0,
-        max_value=1.0
-    )
-    if partial_weight is not None:
-        normalized["evaluation"]["partial_match_weight"] = partial_weight
-
-    gate_mode = _coerce_enum(
-        evaluation_raw.get("must_have_gate_mode"),
-        "must_have_gate_mode",
-        ["all", "coverage_min"],
-        errors
-    )
-    if gate_mode:
-        normalized["evaluation"]["must_have_gate_mode"] = gate_mode
-
-    coverage_min = _coerce_float(
-        evaluation_raw.get("must_have_coverage_min"),
-        "must_have_coverage_min",
-        errors,
-        min_value=0.0,
-        max_value=1.0
-    )
-    if coverage_min is not None:
-        normalized["evaluation"]["must_have_coverage_min"] = coverage_min
-
-    include_nice = _coerce_bool(
-        evaluation_raw.get("include_nice_to_have"),
-        "include_nice_to_have",
-        errors
-    )
-    if include_nice is not None:
-        normalized["evaluation"]["include_nice_to_have"] = include_nice
-
-    weights_override = _normalize_weights(
-        evaluation_raw.get("weights_override"),
-        "weights_override",
-        errors
-    )
-    if weights_override is not None:
-        normalized["evaluation"]["weights_override"] = weights_override
-
-    objective = _coerce_enum(
-        optimization_raw.get("objective"),
-        "objective",
-        ["maximize_candidate_count"],
-        errors
-    )
-    if objective:
-        normalized["optimization"]["objective"] = objective
-
-    threshold = _coerce_float(
-        optimization_raw.get("overall_score_threshold"),
-        "overall_score_threshold",
-        errors,
-        min_value=0.0,
-        max_value=100.0
-    )
-    if threshold is not None:
-        normalized["optimization"]["overall_score_threshold"] = threshold
+    raw_sections = {"evaluation": evaluation_raw, "optimization": optimization_raw}
+    coerced: Dict[str, Any] = {}
+    for section, key, coerce, options in _SETTING_FIELDS:
+        value = raw_sections[section].get(key)
+        if value is not None:
+            value = coerce(value, key, errors=errors, **options)
+        coerced[key] = value
+        if value is not None:
+            normalized[section][key] = value
+    partial_weight = coerced["partial_match_weight"]
+    coverage_min = coerced["must_have_coverage_min"]
 
     if normalized["evaluation"]["match_mode"] == "full_only" and partial_weight is not None:
         warnings.append(
@@ -315,6 +286,10 @@ def build_shock_report(
         base_education_required = bool(required_education.get("required"))
 
     effective = apply_skill_edits(job_data, scenario)
+    base_must_set = set(base_must)
+    base_nice_set = set(base_nice)
+    effective_must_set = set(effective["must_have"])
+    effective_nice_set = set(effective["nice_to_have"])
     effective_min_years = scenario["scenario"]["min_years_override"]
     if effective_min_years is None:
         effective_min_years = base_min_years
@@ -334,10 +309,10 @@ def build_shock_report(
             "from": base_education_required,
             "to": effective_education_required
         },
-        "must_have_added": [s for s in effective["must_have"] if s not in base_must],
-        "must_have_removed": [s for s in base_must if s not in effective["must_have"]],
-        "nice_to_have_added": [s for s in effective["nice_to_have"] if s not in base_nice],
-        "nice_to_have_removed": [s for s in base_nice if s not in effective["nice_to_have"]]
+        "must_have_added": [s for s in effective["must_have"] if s not in base_must_set],
+        "must_have_removed": [s for s in base_must if s not in effective_must_set],
+        "nice_to_have_added": [s for s in effective["nice_to_have"] if s not in base_nice_set],
+        "nice_to_have_removed": [s for s in base_nice if s not in effective_nice_set]
     }
 
 
@@ -356,16 +331,24 @@ def apply_skill_edits(
     remove_set = set(remove.get("must_have", [])) | set(remove.get("nice_to_have", []))
     must = [skill for skill in base_must if skill not in remove_set]
     nice = [skill for skill in base_nice if skill not in remove_set]
+    must_set = set(must)
+    nice_set = set(nice)
 
+    promoted = set()
     for skill in add.get("must_have", []):
-        if skill not in must:
+        if skill not in must_set:
             must.append(skill)
-        if skill in nice:
-            nice.remove(skill)
+            must_set.add(skill)
+        if skill in nice_set:
+            nice_set.discard(skill)
+            promoted.add(skill)
+    if promoted:
+        nice = [skill for skill in nice if skill not in promoted]
 
     for skill in add.get("nice_to_have", []):
-        if skill not in nice and skill not in must:
+        if skill not in nice_set and skill not in must_set:
             nice.append(skill)
+            nice_set.add(skill)
 
     return {"must_have": must, "nice_to_have": nice}
 
@@ -388,18 +371,19 @@ def _coerce_int(
 ) -> Any:
     if value is None:
         return None
-    if isinstance(value, bool):
-        errors.append(f"{label} must be a number.")
-        return None
-    if isinstance(value, float):
-        if value.is_integer():
-            value = int(value)
-        else:
+    if type(value) is not int:
+        if isinstance(value, bool):
+            errors.append(f"{label} must be a number.")
+            return None
+        if isinstance(value, float):
+            if value.is_integer():
+                value = int(value)
+            else:
+                errors.append(f"{label} must be an integer.")
+                return None
+        if not isinstance(value, int):
             errors.append(f"{label} must be an integer.")
             return None
-    if not isinstance(value, int):
-        errors.append(f"{label} must be an integer.")
-        return None
     if value < min_value or value > max_value:
         errors.append(f"{label} must be between {min_value} and {max_value}.")
         return None
@@ -415,12 +399,12 @@ def _coerce_float(
 ) -> Any:
     if value is None:
         return None
-    if isinstance(value, bool):
-        errors.append(f"{label} must be a number.")
-        return None
-    if not isinstance(value, (int, float)):
-        errors.append(f"{label} must be a number.")
-        return None
+    # Exact JSON number types skip the isinstance checks.
+    value_type = type(value)
+    if value_type is not float and value_type is not int:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            errors.append(f"{label} must be a number.")
+            return None
     value = float(value)
     if value < min_value or value > max_value:
         errors.append(f"{label} must be between {min_value} and {max_value}.")
@@ -429,19 +413,18 @@ def _coerce_float(
 
 
 def _coerce_bool(value: Any, label: str, errors: List[str]) -> Any:
-    if value is None:
-        return None
-    if not isinstance(value, bool):
-        errors.append(f"{label} must be a boolean.")
-        return None
-    return value
+    if value is None or value is True or value is False:
+        return value
+    errors.append(f"{label} must be a boolean.")
+    return None
 
 
 def _coerce_enum(
     value: Any,
     label: str,
     allowed: List[str],
-    errors: List[str]
+    errors: List[str],
+    aliases: Optional[Dict[str, str]] = None
 ) -> Any:
     if value is None:
         return None
@@ -452,6 +435,8 @@ def _coerce_enum(
     if value_lower not in allowed:
         errors.append(f"{label} must be one of: {', '.join(allowed)}.")
         return None
+    if aliases:
+        return aliases.get(value_lower, value_lower)
     return value_lower
 
 
@@ -475,6 +460,8 @@ def _normalize_skill_block(
         if not isinstance(raw_list, list):
             errors.append(f"{label}.{key} must be a list.")
             continue
+        # A dict keeps first-seen order while deduplicating in constant time.
+        canonical_skills: Dict[str, None] = {}
         for item in raw_list:
             if not isinstance(item, str):
                 errors.append(f"{label}.{key} items must be strings.")
@@ -485,11 +472,14 @@ def _normalize_skill_block(
                     f"{label}.{key} contains unknown skill: {item}."
                 )
                 continue
-            if canonical not in block[key]:
-                block[key].append(canonical)
+            canonical_skills[canonical] = None
+        block[key] = list(canonical_skills)
     return block
 
 
+_WEIGHT_KEYS = ("must_have", "nice_to_have", "experience", "education")
+
+
 def _normalize_weights(
     value: Any,
     label: str,
@@ -503,38 +493,74 @@ def _normalize_weights(
 
     weights = {}
     total = 0.0
-    for key in ("must_have", "nice_to_have", "experience", "education"):
+    for key in _WEIGHT_KEYS:
         if key not in value:
             errors.append(f"{label} must include {key}.")
             continue
-        raw = value.get(key)
-        if not isinstance(raw, (int, float)) or isinstance(raw, bool):
+        raw = value[key]
+        raw_type = type(raw)
+        if raw_type is float:
+            weight = raw
+        elif raw_type is int or (isinstance(raw, (int, float)) and not isinstance(raw, bool)):
+            weight = float(raw)
+        else:
             errors.append(f"{label}.{key} must be a number.")
             continue
-        weights[key] = float(raw)
-        total += weights[key]
+        weights[key] = weight
+        total += weight
 
     if weights and abs(total - 100.0) > 0.01:
         errors.append(f"{label} weights must sum to 100.")
     return weights if weights else None
 
 
+# Evaluation and optimization settings, in the order their errors are reported.
+# Each entry is (section, key, coercer, coercer options); a None result keeps
+# the default.
+_SETTING_FIELDS: Tuple[Tuple[str, str, Callable[..., Any], Dict[str, Any]], ...] = (
+    (
+        "evaluation",
+        "match_mode",
+        _coerce_enum,
+        {
+            "allowed": ["full_only", "partial_ok", "full", "partial"],
+            "aliases": {"full": "full_only", "partial": "partial_ok"}
+        }
+    ),
+    ("evaluation", "partial_match_weight", _coerce_float, {"min_value": 0.0, "max_value": 1.0}),
+    ("evaluation", "must_have_gate_mode", _coerce_enum, {"allowed": ["all", "coverage_min"]}),
+    ("evaluation", "must_have_coverage_min", _coerce_float, {"min_value": 0.0, "max_value": 1.0}),
+    ("evaluation", "include_nice_to_have", _coerce_bool, {}),
+    ("evaluation", "weights_override", _normalize_weights, {}),
+    ("optimization", "objective", _coerce_enum, {"allowed": ["maximize_candidate_count"]}),
+    ("optimization", "overall_score_threshold", _coerce_float, {"min_value": 0.0, "max_value": 100.0})
+)
+
+
 def _build_skill_catalog(job_data: Dict[str, Any]) -> Dict[str, str]:
     requirements = job_data.get("requirements", {}) if isinstance(job_data, dict) else {}
+    return _skill_catalog(
+        tuple(requirements.get("must_have_skills") or []),
+        tuple(requirements.get("nice_to_have_skills") or [])
+    )
+
+
+# Optimisation runs normalize many scenarios against the same job, so catalogs
+# and skill keys are memoized; callers only read from the returned catalog.
+@lru_cache(maxsize=64)
+def _skill_catalog(must_have: Tuple[str, ...], nice_to_have: Tuple[str, ...]) -> Dict[str, str]:
     catalog: Dict[str, str] = {}
-    for skill in (requirements.get("must_have_skills") or []):
-        key = _normalize_skill_key(skill)
-        if key:
-            catalog[key] = skill
-    for skill in (requirements.get("nice_to_have_skills") or []):
+    for skill in must_have + nice_to_have:
         key = _normalize_skill_key(skill)
         if key:
             catalog[key] = skill
     return catalog
 
 
+@lru_cache(maxsize=4096)
 def _normalize_skill_key(skill: str) -> str:
-    return " ".join(skill.strip().lower().split())
+    # Interned so that keys from differently spelled inputs share one object.
+    return sys.intern(" ".join(skill.strip().casefold().split()))
 
 
 def _canonicalize_skill(skill: str, catalog: Dict[str, str]) -> Any:
@@ -548,6 +574,10 @@ def _warn_on_skill_moves(
     job_data: Dict[str, Any],
     warnings: List[str]
 ) -> None:
+    # Most scenarios edit no skills; skip building the requirement sets for them.
+    if not any(add_block.values()) and not any(remove_block.values()):
+        return
+
     requirements = job_data.get("requirements", {}) if isinstance(job_data, dict) else {}
     base_must = set(requirements.get("must_have_skills") or [])
     base_nice = set(requirements.get("nice_to_have_skills") or [])
@@ -1,9 +1,96 @@
-import json
+import os
 from datetime import datetime
 
+# The app validates its configuration on import; set it here so every test
+# module, and every pytest-xdist worker, sees it before anything imports src.api.
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("LLM_PROVIDER", "openai")
 
-def deep_copy(value):
-    return json.loads(json.dumps(value))
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.database.connection import Base
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "web: FastAPI TestClient tests that import src.api")
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    # One in-memory database for the whole run; StaticPool keeps it on a single
+    # connection so the schema is only created once.
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT rollback; let
+    # SQLAlchemy emit BEGIN instead (the SQLAlchemy SQLite savepoint recipe).
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    # Each test runs inside a transaction that is rolled back afterwards; commits
+    # made by the code under test only release savepoints.
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    # Imported on first use so collecting unrelated tests does not load the app.
+    from src.api import app
+
+    return app
+
+
+@pytest.fixture(scope="module")
+def api_client(app_module):
+    from fastapi.testclient import TestClient
+
+    yield TestClient(app_module.app)
+    app_module.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def stub_db(app_module):
+    """Replace the API's database dependency with a placeholder object."""
+    def override_db():
+        yield object()
+
+    app_module.app.dependency_overrides[app_module.get_db] = override_db
+    yield
+    app_module.app.dependency_overrides.pop(app_module.get_db, None)
+
+
+@pytest.fixture(scope="module")
+def cli_runner():
+    from click.testing import CliRunner
+
+    return CliRunner()
 
 
 def make_job_data():
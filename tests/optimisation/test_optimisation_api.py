@@ -1,22 +1,9 @@
-import os
+import pytest
 
-os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
-os.environ.setdefault("OPENAI_API_KEY", "test")
-os.environ.setdefault("LLM_PROVIDER", "openai")
+pytestmark = pytest.mark.web
 
-from fastapi.testclient import TestClient
-
-from src.api import app as app_module
-
-
-def test_api_optimisation_overrides(monkeypatch):
-    client = TestClient(app_module.app)
-
-    def override_db():
-        yield object()
-
-    app_module.app.dependency_overrides[app_module.get_db] = override_db
 
+def test_api_optimisation_overrides(monkeypatch, app_module, api_client, stub_db):
     captured = {}
 
     def fake_run_optimisation(*_args, **kwargs):
@@ -26,7 +13,7 @@ def test_api_optimisation_overrides(monkeypatch):
 
     monkeypatch.setattr(app_module, "run_optimisation", fake_run_optimisation)
 
-    response = client.post(
+    response = api_client.post(
         "/api/optimisation",
         json={
             "job_id": 1,
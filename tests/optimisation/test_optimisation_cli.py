@@ -1,5 +1,3 @@
-from click.testing import CliRunner
-
 from src.cli import commands
 
 
@@ -8,9 +6,7 @@ class DummySession:
         pass
 
 
-def test_cli_outputs_table_before_candidates(monkeypatch):
-    runner = CliRunner()
-
+def test_cli_outputs_table_before_candidates(monkeypatch, cli_runner):
     monkeypatch.setattr(commands, "init_database", lambda: None)
     monkeypatch.setattr(commands, "get_db_session", lambda: DummySession())
 
@@ -39,11 +35,11 @@ def test_cli_outputs_table_before_candidates(monkeypatch):
 
     monkeypatch.setattr(commands, "run_optimisation", fake_run_optimisation)
 
-    with runner.isolated_filesystem():
+    with cli_runner.isolated_filesystem():
         with open("optimisation.json", "w", encoding="utf-8") as handle:
             handle.write("{}")
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             commands.cli,
             ["optimisation", "1", "--optimisation-file", "optimisation.json", "--detail"]
         )
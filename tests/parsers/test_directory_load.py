@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from src.cli import commands
+from src.database.models import Application
+from src.parsers.job_parser import JobParser
+from src.parsers.resume_parser import ResumeParser
+
+from tests.conftest import make_job_data
+
+
+def test_directory_load_parses_resumes_in_one_batch(monkeypatch, cli_runner, db):
+    batches = []
+
+    def fake_parse_files(self, file_paths, batch_size=4):
+        batches.append([Path(path).name for path in file_paths])
+        return [{"basics": {"name": f"Candidate {index}"}} for index in range(len(file_paths))]
+
+    def fail_parse_file(self, file_path):
+        raise AssertionError("resumes should not be parsed one at a time")
+
+    monkeypatch.setattr(commands, "init_database", lambda: None)
+    monkeypatch.setattr(commands, "get_db_session", lambda: db)
+    monkeypatch.setattr(JobParser, "parse_file", lambda self, file_path: make_job_data())
+    monkeypatch.setattr(ResumeParser, "parse_files", fake_parse_files)
+    monkeypatch.setattr(ResumeParser, "parse_file", fail_parse_file)
+    monkeypatch.setattr(commands, "match_candidate_to_job", lambda resume, job: {"overall_score": 50})
+
+    with cli_runner.isolated_filesystem() as root:
+        for name, text in (("job.txt", "job"), ("applications/a.txt", "a"), ("applications/b.txt", "b")):
+            path = Path(root) / "devops" / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+
+        result = cli_runner.invoke(commands.cli, ["directory-load", root])
+
+    assert result.exit_code == 0, result.output
+    assert "applications: 2" in result.output
+    assert batches == [["a.txt", "b.txt"]]
+    assert db.query(Application).count() == 2
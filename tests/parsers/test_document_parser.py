@@ -0,0 +1,222 @@
+import threading
+
+import pytest
+
+from src.config import Config
+from src.matching import matcher
+from src.parsers import base
+from src.parsers.base import TRUNCATION_MARKER, DocumentParser, clip_text
+from src.parsers.cache import ParseCache
+from src.parsers import extraction
+from src.parsers.extraction import extract_text
+from src.parsers.job_parser import JobParser
+
+
+class FakeLLMClient:
+    calls = []
+
+    def __init__(self, model=None):
+        self.model = model
+
+    def call_llm(self, prompt, **kwargs):
+        FakeLLMClient.calls.append(kwargs["function_name"])
+        if kwargs["function_name"].endswith("_batch"):
+            count = prompt.count("Job Description ")
+            return {
+                "documents": [
+                    {"basics": {"title": f"Role {index}"}} for index in range(1, count + 1)
+                ]
+            }
+        return {"basics": {"title": "Single"}}
+
+
+def _write_jobs(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"job_{index}.txt"
+        path.write_text(f"Job posting {index}: " + "details " * 20, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_parse_files_batches_and_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr(matcher, "LLMClient", FakeLLMClient)
+    monkeypatch.setattr(matcher, "_LLM_CLIENTS", {})
+    monkeypatch.setattr(Config, "PARSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(Config, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+    FakeLLMClient.calls = []
+
+    paths = _write_jobs(tmp_path, 5)
+    results = JobParser().parse_files(paths, batch_size=3)
+
+    assert [item["basics"]["title"] for item in results] == [
+        "Role 1", "Role 2", "Role 3", "Role 1", "Role 2"
+    ]
+    assert FakeLLMClient.calls == ["parse_job_description_batch"] * 2
+
+    FakeLLMClient.calls = []
+    assert JobParser().parse_file(paths[1]) == {"basics": {"title": "Role 2"}}
+    assert FakeLLMClient.calls == []
+
+
+def test_parse_files_sends_batches_concurrently(monkeypatch, tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+
+    class WaitingClient(FakeLLMClient):
+        def call_llm(self, prompt, **kwargs):
+            barrier.wait()
+            return super().call_llm(prompt, **kwargs)
+
+    monkeypatch.setattr(matcher, "LLMClient", WaitingClient)
+    monkeypatch.setattr(matcher, "_LLM_CLIENTS", {})
+    monkeypatch.setattr(Config, "PARSE_CACHE_ENABLED", False)
+    FakeLLMClient.calls = []
+
+    results = JobParser().parse_files(_write_jobs(tmp_path, 4), batch_size=2)
+
+    assert [item["basics"]["title"] for item in results] == [
+        "Role 1", "Role 2", "Role 1", "Role 2"
+    ]
+
+
+def test_parse_files_falls_back_to_single_documents(monkeypatch, tmp_path):
+    class ShortBatchClient(FakeLLMClient):
+        def call_llm(self, prompt, **kwargs):
+            if kwargs["function_name"].endswith("_batch"):
+                FakeLLMClient.calls.append(kwargs["function_name"])
+                return {"documents": [{"basics": {"title": "Only one"}}]}
+            return super().call_llm(prompt, **kwargs)
+
+    prepared = []
+    original_prepare = JobParser._prepare
+
+    def counting_prepare(self, text):
+        prepared.append(text)
+        return original_prepare(self, text)
+
+    monkeypatch.setattr(matcher, "LLMClient", ShortBatchClient)
+    monkeypatch.setattr(matcher, "_LLM_CLIENTS", {})
+    monkeypatch.setattr(Config, "PARSE_CACHE_ENABLED", False)
+    monkeypatch.setattr(JobParser, "_prepare", counting_prepare)
+    FakeLLMClient.calls = []
+
+    results = JobParser().parse_files(_write_jobs(tmp_path, 2))
+
+    assert [item["basics"]["title"] for item in results] == ["Single", "Single"]
+    assert FakeLLMClient.calls == [
+        "parse_job_description_batch",
+        "parse_job_description",
+        "parse_job_description"
+    ]
+    # The fallback parses reuse the prepared text instead of clipping it again.
+    assert len(prepared) == 2
+
+
+def test_clip_text_keeps_head_and_tail():
+    text = "a" * 50 + "b" * 50
+
+    assert clip_text(text, 200) == text
+    clipped = clip_text(text, 40)
+    assert clipped == "a" * 30 + TRUNCATION_MARKER + "b" * 10
+
+
+def test_large_text_files_decode_only_the_clipped_ends(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "PARSE_MAX_INPUT_CHARS", 40)
+    body = "start é " + "middle line\n" * 200 + " ünd"
+    path = tmp_path / "large.txt"
+    path.write_text(body, encoding="utf-8")
+
+    text = extract_text(path)
+
+    assert len(text) < len(body)
+    assert clip_text(text, 40) == clip_text(body, 40)
+
+
+def test_extracted_docx_text_is_cached_until_the_file_changes(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "PARSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(Config, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+    calls = []
+
+    def fake_docx(file_path):
+        calls.append(file_path)
+        return file_path.read_bytes().decode("utf-8")
+
+    monkeypatch.setitem(extraction._EXTRACTORS, ".docx", fake_docx)
+    path = tmp_path / "resume.docx"
+    path.write_bytes(b"first")
+
+    assert extraction.extract_text(path) == "first"
+    assert extraction.extract_text(path) == "first"
+    assert len(calls) == 1
+
+    path.write_bytes(b"second version")
+    assert extraction.extract_text(path) == "second version"
+    assert len(calls) == 2
+
+
+def test_join_pages_skips_middle_pages_outside_the_budget():
+    pages = [f"page {index} " + "x" * 20 for index in range(50)]
+    full_text = "\n".join(pages)
+    read = []
+
+    def read_page(index):
+        read.append(index)
+        return pages[index]
+
+    text = extraction._join_pages(len(pages), read_page, 100)
+
+    assert len(read) < len(pages)
+    assert clip_text(text, 100) == clip_text(full_text, 100)
+    assert extraction._join_pages(3, lambda index: pages[index], 10_000) == "\n".join(pages[:3])
+
+
+def test_short_documents_skip_the_llm(monkeypatch, tmp_path):
+    monkeypatch.setattr(matcher, "LLMClient", FakeLLMClient)
+    monkeypatch.setattr(matcher, "_LLM_CLIENTS", {})
+    monkeypatch.setattr(Config, "PARSE_CACHE_ENABLED", False)
+    FakeLLMClient.calls = []
+    path = tmp_path / "job.txt"
+    path.write_text("Backend Engineer", encoding="utf-8")
+
+    result = JobParser().parse_file(str(path))
+
+    assert result["basics"]["title"] == "Unknown Position"
+    assert result["description"] == "Backend Engineer"
+    assert FakeLLMClient.calls == []
+
+
+def test_parse_cache_serves_repeat_lookups_from_memory(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "PARSE_CACHE_ENABLED", True)
+    cache = ParseCache(str(tmp_path))
+    cache.set("key", {"skills": ["python"]})
+    (tmp_path / "key.json").unlink()
+
+    first = cache.get("key")
+    first["skills"].append("mutated")
+
+    assert cache.get("key") == {"skills": ["python"]}
+
+
+def test_document_parser_subclasses_must_define_model_and_fallback():
+    class IncompleteParser(DocumentParser):
+        def _model(self):
+            return "model"
+
+    with pytest.raises(TypeError):
+        IncompleteParser()
+
+
+def test_disabled_caches_skip_key_hashing(monkeypatch, tmp_path):
+    def fail_key(*_args):
+        raise AssertionError("cache keys should not be built while the cache is off")
+
+    monkeypatch.setattr(matcher, "LLMClient", FakeLLMClient)
+    monkeypatch.setattr(matcher, "_LLM_CLIENTS", {})
+    monkeypatch.setattr(Config, "PARSE_CACHE_ENABLED", False)
+    monkeypatch.setattr(base, "parse_cache_key", fail_key)
+    monkeypatch.setattr(extraction, "text_cache_key", fail_key)
+    monkeypatch.setitem(extraction._EXTRACTORS, ".pdf", lambda path: "Job posting: " + "details " * 20)
+    pdf_path = tmp_path / "job.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    assert JobParser().parse_file(str(pdf_path)) == {"basics": {"title": "Single"}}
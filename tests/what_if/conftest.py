@@ -0,0 +1,24 @@
+import pytest
+
+
+_SUMMARY_ROW = {
+    "id": 1,
+    "candidate": "Alex",
+    "job_title": "DevOps",
+    "company": "CloudScale",
+    "recommendation": "Consider",
+    "created": "2024-01-01 12:00",
+    "original_score": 40.0,
+    "scenario_score": 55.4
+}
+
+
+@pytest.fixture
+def fake_run_what_if():
+    """A run_what_if stand-in that returns a one-row summary table."""
+    payload = {"summary_table": [dict(_SUMMARY_ROW)]}
+
+    def run_what_if(*_args, **_kwargs):
+        return payload
+
+    return run_what_if
@@ -1,5 +1,3 @@
-from click.testing import CliRunner
-
 from src.cli import commands
 
 
@@ -8,31 +6,13 @@ class DummySession:
         pass
 
 
-def test_cli_summary_output(monkeypatch):
-    runner = CliRunner()
-
+def test_cli_summary_output(monkeypatch, cli_runner, fake_run_what_if):
     monkeypatch.setattr(commands, "init_database", lambda: None)
     monkeypatch.setattr(commands, "get_db_session", lambda: DummySession())
 
-    def fake_run_what_if(*_args, **_kwargs):
-        return {
-            "summary_table": [
-                {
-                    "id": 1,
-                    "candidate": "Alex",
-                    "job_title": "DevOps",
-                    "company": "CloudScale",
-                    "recommendation": "Consider",
-                    "created": "2024-01-01 12:00",
-                    "original_score": 40.0,
-                    "scenario_score": 55.4
-                }
-            ]
-        }
-
     monkeypatch.setattr(commands, "run_what_if", fake_run_what_if)
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         commands.cli,
         ["what-if", "scenario text", "1", "--summary"]
     )
@@ -42,12 +22,11 @@ def test_cli_summary_output(monkeypatch):
     assert "Scenario Score" in result.output
 
 
-def test_cli_summary_disallows_explain(monkeypatch):
-    runner = CliRunner()
+def test_cli_summary_disallows_explain(monkeypatch, cli_runner):
     monkeypatch.setattr(commands, "init_database", lambda: None)
     monkeypatch.setattr(commands, "get_db_session", lambda: DummySession())
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         commands.cli,
         ["what-if", "scenario text", "1", "--summary", "--explain"]
     )
@@ -1,13 +1,24 @@
 import pytest
 
 from src.what_if.evaluator import evaluate_applications
-from src.what_if.scenario import DEFAULT_SCENARIO, ScenarioValidationError
+from src.what_if.scenario import ScenarioValidationError, copy_default_scenario
 
-from tests.conftest import deep_copy, make_job_data, make_match_data, make_application
+from tests.conftest import make_job_data, make_match_data, make_application
+
+
+# The evaluator only reads match data, so tests share this payload unchanged.
+PARTIAL_MATCH_DATA = make_match_data(
+    must_full=["Skill A", "Skill B"],
+    must_partial=["Skill C"],
+    must_missing=["Skill D"],
+    nice_full=[],
+    nice_partial=[],
+    nice_missing=["Skill E", "Skill F"]
+)
 
 
 def make_scenario():
-    scenario = deep_copy(DEFAULT_SCENARIO)
+    scenario = copy_default_scenario()
     scenario["scenario"]["education_required_override"] = False
     scenario["evaluation"]["match_mode"] = "partial_ok"
     scenario["evaluation"]["must_have_gate_mode"] = "coverage_min"
@@ -18,15 +29,7 @@ def make_scenario():
 
 def test_evaluator_partial_match_scores():
     job_data = make_job_data()
-    match_data = make_match_data(
-        must_full=["Skill A", "Skill B"],
-        must_partial=["Skill C"],
-        must_missing=["Skill D"],
-        nice_full=[],
-        nice_partial=[],
-        nice_missing=["Skill E", "Skill F"]
-    )
-    application = make_application(1, "Alex", "DevOps", "CloudScale", match_data, 40.0)
+    application = make_application(1, "Alex", "DevOps", "CloudScale", PARTIAL_MATCH_DATA, 40.0)
     scenario = make_scenario()
 
     result = evaluate_applications(
@@ -66,16 +69,8 @@ def test_evaluator_full_only_requires_full_partial_data():
 
 def test_summary_table_sorted_by_original_score():
     job_data = make_job_data()
-    match_data = make_match_data(
-        must_full=["Skill A", "Skill B"],
-        must_partial=["Skill C"],
-        must_missing=["Skill D"],
-        nice_full=[],
-        nice_partial=[],
-        nice_missing=["Skill E", "Skill F"]
-    )
-    high_score_app = make_application(3, "Casey", "DevOps", "CloudScale", match_data, 90.0)
-    low_score_app = make_application(4, "Robin", "DevOps", "CloudScale", match_data, 30.0)
+    high_score_app = make_application(3, "Casey", "DevOps", "CloudScale", PARTIAL_MATCH_DATA, 90.0)
+    low_score_app = make_application(4, "Robin", "DevOps", "CloudScale", PARTIAL_MATCH_DATA, 30.0)
     scenario = make_scenario()
 
     result = evaluate_applications(
@@ -88,3 +83,19 @@ def test_summary_table_sorted_by_original_score():
     table = result["summary_table"]
     assert table[0]["original_score"] == 90.0
     assert table[1]["original_score"] == 30.0
+
+
+def test_evaluator_without_applications_returns_empty_summary():
+    result = evaluate_applications(
+        [],
+        make_job_data(),
+        make_scenario(),
+        include_details=True,
+        include_summary_table=True
+    )
+
+    assert result["summary"]["applications_total"] == 0
+    assert result["summary"]["average_score"] == 0.0
+    assert result["warnings"] == []
+    assert result["candidates"] == []
+    assert result["summary_table"] == []
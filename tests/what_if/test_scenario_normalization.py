@@ -1,10 +1,21 @@
 import pytest
 
-from src.what_if.scenario import normalize_scenario, ScenarioValidationError
+from src.what_if.scenario import (
+    DEFAULT_SCENARIO,
+    ScenarioValidationError,
+    copy_default_scenario,
+    normalize_scenario
+)
 
 from tests.conftest import make_job_data
 
 
+@pytest.fixture(scope="module")
+def job_data():
+    # normalize_scenario only reads the job, so one copy serves every case.
+    return make_job_data()
+
+
 def base_raw_scenario():
     return {
         "scenario": {
@@ -28,51 +39,78 @@ def base_raw_scenario():
     }
 
 
-def test_normalize_scenario_maps_match_mode():
-    job_data = make_job_data()
-    raw = base_raw_scenario()
-    normalized, warnings = normalize_scenario(raw, job_data)
-    assert normalized["evaluation"]["match_mode"] == "partial_ok"
-    assert warnings == []
+def _keep(raw):
+    pass
 
 
-def test_normalize_scenario_warns_on_gate_mode_override():
-    job_data = make_job_data()
-    raw = base_raw_scenario()
+def _override_gate_mode(raw):
     raw["evaluation"]["must_have_gate_mode"] = "all"
     raw["evaluation"]["must_have_coverage_min"] = 0.5
-    normalized, warnings = normalize_scenario(raw, job_data)
-    assert normalized["evaluation"]["must_have_gate_mode"] == "all"
-    assert any("coverage_min is ignored" in warning for warning in warnings)
 
 
-def test_normalize_scenario_rejects_unknown_skills():
-    job_data = make_job_data()
-    raw = base_raw_scenario()
-    raw["scenario"]["skills_add"]["must_have"] = ["Unknown Skill"]
-    with pytest.raises(ScenarioValidationError) as exc:
-        normalize_scenario(raw, job_data)
-    assert any("unknown skill" in error.lower() for error in exc.value.errors)
+def _move_skill_to_must_have(raw):
+    raw["scenario"]["skills_add"]["must_have"] = ["skill e"]
 
 
-def test_normalize_scenario_skill_move_warning():
-    job_data = make_job_data()
-    raw = base_raw_scenario()
-    raw["scenario"]["skills_add"]["must_have"] = ["skill e"]
-    normalized, warnings = normalize_scenario(raw, job_data)
-    assert normalized["scenario"]["skills_add"]["must_have"] == ["Skill E"]
-    assert any("moved from nice_to_have to must_have" in warning for warning in warnings)
+def _add_unknown_skill(raw):
+    raw["scenario"]["skills_add"]["must_have"] = ["Unknown Skill"]
 
 
-def test_normalize_scenario_rejects_invalid_weights():
-    job_data = make_job_data()
-    raw = base_raw_scenario()
+def _set_invalid_weights(raw):
     raw["evaluation"]["weights_override"] = {
         "must_have": 40,
         "nice_to_have": 20,
         "experience": 20,
         "education": 10
     }
+
+
+@pytest.mark.parametrize(
+    "mutate, section, field, expected, warning",
+    [
+        pytest.param(_keep, "evaluation", "match_mode", "partial_ok", None, id="maps_match_mode"),
+        pytest.param(
+            _override_gate_mode, "evaluation", "must_have_gate_mode", "all",
+            "coverage_min is ignored", id="warns_on_gate_mode_override"
+        ),
+        pytest.param(
+            _move_skill_to_must_have, "scenario", "skills_add", {"must_have": ["Skill E"], "nice_to_have": []},
+            "moved from nice_to_have to must_have", id="skill_move_warning"
+        ),
+    ]
+)
+def test_normalize_scenario(job_data, mutate, section, field, expected, warning):
+    raw = base_raw_scenario()
+    mutate(raw)
+    normalized, warnings = normalize_scenario(raw, job_data)
+    assert normalized[section][field] == expected
+    if warning is None:
+        assert warnings == []
+    else:
+        assert any(warning in message for message in warnings)
+
+
+@pytest.mark.parametrize(
+    "mutate, error",
+    [
+        pytest.param(_add_unknown_skill, "unknown skill", id="rejects_unknown_skills"),
+        pytest.param(_set_invalid_weights, "weights must sum to 100", id="rejects_invalid_weights"),
+    ]
+)
+def test_normalize_scenario_rejects(job_data, mutate, error):
+    raw = base_raw_scenario()
+    mutate(raw)
     with pytest.raises(ScenarioValidationError) as exc:
         normalize_scenario(raw, job_data)
-    assert any("weights must sum to 100" in error for error in exc.value.errors)
+    assert any(error in message.lower() for message in exc.value.errors)
+
+
+def test_copy_default_scenario_is_independent():
+    copied = copy_default_scenario()
+    assert copied == DEFAULT_SCENARIO
+
+    copied["scenario"]["skills_add"]["must_have"].append("Skill A")
+    copied["evaluation"]["match_mode"] = "full_only"
+
+    assert DEFAULT_SCENARIO["scenario"]["skills_add"]["must_have"] == []
+    assert DEFAULT_SCENARIO["evaluation"]["match_mode"] == "partial_ok"